@@ -0,0 +1 @@
+"""Benchmark engine sentiNews: korpus sintetis, mock API & runner (python -m benchmarks)"""
@@ -0,0 +1,95 @@
+"""Generator korpus artikel sintetis dua bahasa (id/en) yang deterministik
+
+Artikel dibangun dari lexicon SentimentAnalyzer ditambah kata pengisi, jadi
+proporsi positif/negatif/netral dan panjang teks mirip berita sungguhan.
+Seed yang sama selalu menghasilkan korpus yang sama.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from sentinews.analyzer import SentimentAnalyzer
+
+FILLER_WORDS = {
+    'id': [
+        'harga', 'saham', 'pasar', 'investor', 'hari', 'ini', 'menurut', 'analis',
+        'bursa', 'perdagangan', 'sektor', 'perusahaan', 'laporan', 'kuartal', 'tahun',
+        'pemerintah', 'bank', 'rupiah', 'indeks', 'dan', 'yang', 'di', 'pada', 'dengan'
+    ],
+    'en': [
+        'price', 'stock', 'market', 'investors', 'today', 'according', 'analysts',
+        'exchange', 'trading', 'sector', 'company', 'report', 'quarter', 'year',
+        'government', 'bank', 'dollar', 'index', 'and', 'the', 'in', 'on', 'with', 'of'
+    ]
+}
+
+TOPICS = ['Bitcoin', 'BTC', 'XRP', 'Ethereum', 'ANTM', 'Aneka Tambang', 'TLKM', 'Telkom',
+          'BBRI', 'BBCA', 'IHSG', 'Nasdaq']
+
+SOURCES = {
+    'id': ['kontan', 'cnbcindonesia', 'detik', 'kompas', 'bisnis', 'katadata', 'tempo'],
+    'en': ['reuters', 'bloomberg', 'coindesk', 'cnbc', 'forbes', 'yahoo', 'marketwatch']
+}
+
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _lexicon():
+    analyzer = SentimentAnalyzer()
+    return {
+        'id': (analyzer.positive_words_id, analyzer.negative_words_id),
+        'en': (analyzer.positive_words_en, analyzer.negative_words_en)
+    }
+
+
+def iter_articles(count, seed=0, id_ratio=0.5, duplicate_ratio=0.05, topic=None):
+    """Yield `count` artikel sintetis (lazy, aman untuk korpus 1 juta artikel)
+
+    duplicate_ratio: porsi artikel yang menyalin ulang judul artikel sebelumnya
+    (syndication) agar jalur dedup ikut teruji.
+    """
+    rng = random.Random(seed)
+    lexicon = _lexicon()
+    recent_titles = []
+
+    for i in range(count):
+        language = 'id' if rng.random() < id_ratio else 'en'
+        positive, negative = lexicon[language]
+        filler = FILLER_WORDS[language]
+        subject = topic or rng.choice(TOPICS)
+
+        if recent_titles and rng.random() < duplicate_ratio:
+            title = rng.choice(recent_titles)
+        else:
+            words = rng.choices(filler, k=rng.randint(4, 9))
+            words.insert(rng.randrange(len(words)), subject)
+            # Kira-kira sepertiga positif, sepertiga negatif, sisanya netral
+            mood = rng.random()
+            if mood < 0.35:
+                words.append(rng.choice(positive))
+            elif mood < 0.7:
+                words.append(rng.choice(negative))
+            title = ' '.join(words).capitalize()
+            recent_titles.append(title)
+            if len(recent_titles) > 100:
+                recent_titles.pop(0)
+
+        body = rng.choices(filler, k=rng.randint(15, 40)) + rng.choices(positive + negative, k=rng.randint(0, 3))
+        rng.shuffle(body)
+        description = ' '.join(body[:len(body) // 2])
+
+        published = EPOCH + timedelta(seconds=rng.randrange(90 * 24 * 3600))
+
+        yield {
+            'title': title,
+            'description': description,
+            'content': ' '.join(body),
+            'source': rng.choice(SOURCES[language]),
+            'url': f"https://example.{language}/news/{seed}/{i}",
+            'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'language': language
+        }
+
+
+def generate_articles(count, seed=0, **kwargs):
+    """Daftar `count` artikel sintetis (lihat iter_articles)"""
+    return list(iter_articles(count, seed=seed, **kwargs))
@@ -0,0 +1,165 @@
+"""Bandingkan label KeywordMatcher dengan pencocokan substring lama
+
+Sebelum KeywordMatcher, keyword dicocokkan sebagai substring teks (`word in
+text.lower()`), sehingga bentuk berimbuhan ('surges', 'kenaikan') ikut
+terhitung, tetapi 'up' juga cocok di dalam 'update'. Skrip ini menjalankan
+kedua cara pada korpus contoh dan melaporkan persentase label yang sama
+serta setiap perbedaannya (keyword yang hanya ditemukan salah satu cara).
+
+Contoh:
+    python -m benchmarks.lexicon_agreement
+    python -m benchmarks.lexicon_agreement --jsonl artikel.jsonl --min-agreement 0.95
+
+Perbedaan dikelompokkan per jenis (lihat classify); exit code 1 bila ada
+perbedaan yang tidak terjelaskan atau kesepakatan di bawah --min-agreement.
+"""
+import argparse
+from collections import Counter
+import json
+import sys
+
+from sentinews.analyzer import TOKEN_PATTERN, SentimentAnalyzer
+
+from .corpus import generate_articles
+
+# Judul berita contoh (id/en) dengan bentuk berimbuhan & kata yang memuat
+# keyword sebagai substring
+SAMPLE_HEADLINES = [
+    "Bitcoin surges as ETF gains mount",
+    "Ethereum drops 5% amid losses",
+    "Kenaikan harga saham perbankan berlanjut",
+    "Penurunan IHSG tertahan aksi beli asing",
+    "Rupiah menguatnya terbatas jelang rilis data inflasi",
+    "Nasdaq rallies as chipmakers jump",
+    "Oil prices slumped after weaker demand data",
+    "Stocks tumbled, investors fearing recession",
+    "Gold climbs higher on safe-haven demand",
+    "Crypto market rebounds, traders turn optimistic",
+    "Telkom reports stronger quarterly profits",
+    "Shares plunged after disappointing guidance",
+    "Regulators warn of rising risks in lending",
+    "XRP extends declines as lawsuit concerns grow",
+    "Software update released for trading platform",
+    "Bank opens new window for startup loans",
+    "Analysts against raising rates this quarter",
+    "Enterprise spending outlook unchanged",
+    "Investors download annual report ahead of meeting",
+    "Saham ANTM melemah akibat aksi ambil untung",
+    "Keuntungan emiten tambang meningkat tajam",
+    "Kerugiannya menyusut berkat efisiensi",
+    "Pertumbuhan ekonomi kuartal ini menjanjikan",
+    "Investor khawatir terhadap kenaikan suku bunga",
+    "BBCA mencatatkan kinerja cemerlang dan stabil",
+    "Harga BTC anjlok setelah pengumuman regulasi",
+    "Kemajuan proyek infrastruktur menguntungkan investor",
+    "Pasar tertekan oleh krisis energi global",
+    "Kekhawatiran resesi membuat rupiah melemah",
+    "Pengamanan sistem pembayaran diperkuat",
+    "Market crash fears ease as volatility drops",
+    "Bullish sentiment returns after weeks of bearish trading",
+    "Company posts surplus, shares advance",
+    "Bitcoin miners struggle with falling revenue",
+    "Tech rally fades as yields increase",
+]
+
+
+def legacy_labels(analyzer, text):
+    """Label & keyword versi lama (substring)
+
+    Keyword yang ada di lexicon id & en dihitung sekali, seperti sejak
+    KeywordMatcher, agar yang dibandingkan hanya cara pencocokannya.
+    """
+    text_lower = text.lower()
+    positive = [word for word in dict.fromkeys(analyzer.all_positive) if word in text_lower]
+    negative = [word for word in dict.fromkeys(analyzer.all_negative) if word in text_lower]
+    if len(positive) > len(negative):
+        label = 'positive'
+    elif len(negative) > len(positive):
+        label = 'negative'
+    else:
+        label = 'neutral'
+    return label, set(positive), set(negative)
+
+
+def classify(analyzer, text, legacy_only, matcher_only):
+    """Jenis perbedaan label:
+
+    - 'batas kata': keyword lama hanya ada di dalam kata lain ('up' di 'update')
+    - 'keyword bersarang': keyword lama ada di dalam keyword lain yang sudah
+      dihitung ('lemah' di 'melemah'); satu kata kini dihitung sekali
+    - 'imbuhan': keyword baru ditemukan lewat bentuk berimbuhan ('penurunan')
+    - 'lainnya': tidak terjelaskan (regresi)
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    kinds = set()
+    for keyword in legacy_only:
+        containing = [token for token in tokens if keyword in token]
+        if containing and all(analyzer.matcher.lookup(token) for token in containing):
+            kinds.add('keyword bersarang')
+        elif containing and not any(analyzer.matcher.lookup(token) for token in containing):
+            kinds.add('batas kata')
+        else:
+            kinds.add('lainnya')
+    if matcher_only:
+        kinds.add('imbuhan')
+    return sorted(kinds or {'lainnya'})
+
+
+def compare(analyzer, texts):
+    """(jumlah teks, list perbedaan label) antara cara lama dan KeywordMatcher"""
+    differences = []
+    for text in texts:
+        old_label, old_positive, old_negative = legacy_labels(analyzer, text)
+        hits = analyzer.matcher.distinct(text)
+        new_label = analyzer.analyze(text)[0]
+        if old_label != new_label:
+            legacy_only = sorted((old_positive | old_negative) - set(hits['positive']) - set(hits['negative']))
+            matcher_only = sorted(set(hits['positive'] + hits['negative']) - old_positive - old_negative)
+            differences.append({
+                'text': text,
+                'legacy': old_label,
+                'matcher': new_label,
+                'legacy_only': legacy_only,
+                'matcher_only': matcher_only,
+                'inside': sorted({token for token in TOKEN_PATTERN.findall(text.lower())
+                                  for keyword in legacy_only if keyword in token}),
+                'kind': classify(analyzer, text, legacy_only, matcher_only),
+            })
+    return len(texts), differences
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jsonl', metavar='FILE', help='Artikel JSON per baris (title/description/content)')
+    parser.add_argument('--corpus', type=int, default=0, help='Tambah N artikel sintetis dari benchmarks.corpus')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--min-agreement', type=float, default=0.0,
+                        help='Batas persentase label sama (0-1), selain syarat tanpa perbedaan "lainnya"')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    analyzer = SentimentAnalyzer()
+
+    articles = generate_articles(args.corpus, seed=args.seed) if args.corpus else []
+    if args.jsonl:
+        with open(args.jsonl, encoding='utf-8') as f:
+            articles.extend(json.loads(line) for line in f if line.strip())
+    texts = SAMPLE_HEADLINES + [
+        f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}"
+        for article in articles
+    ]
+
+    total, differences = compare(analyzer, texts)
+    agreement = 1 - len(differences) / total if total else 1.0
+    kinds = Counter(kind for difference in differences for kind in difference['kind'])
+    for difference in differences:
+        print(json.dumps(difference, ensure_ascii=False))
+    print(f"kesepakatan label: {agreement:.1%} ({total - len(differences)}/{total}); "
+          f"perbedaan per jenis: {dict(kinds)}")
+    return 0 if agreement >= args.min_agreement and not kinds['lainnya'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
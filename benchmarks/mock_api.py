@@ -0,0 +1,178 @@
+"""Server HTTP lokal pengganti newsdata.io & gnews.io untuk benchmark
+
+Meniru bentuk payload kedua provider dengan latensi, error 5xx dan 429
+yang bisa diatur. Respons, status & latensi ditentukan oleh seed + path +
+parameter query (+ nomor percobaan untuk request yang diulang), sehingga run
+yang sama selalu menerima hasil yang sama, berapa pun request yang berjalan
+bersamaan.
+
+    with MockNewsServer(latency=0.2, error_rate=0.05) as server:
+        client = NewsAPIClient(base_urls=server.base_urls)
+"""
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .corpus import iter_articles
+
+NEWSDATA_PATH = '/api/1/news'
+GNEWS_PATH = '/api/v4/search'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server.mock
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path not in (NEWSDATA_PATH, GNEWS_PATH):
+            return self._send(404, {'status': 'error', 'message': 'not found'})
+
+        rng = server.request_rng(url.path, params)
+        status = server.roll(rng)
+
+        if server.latency:
+            time.sleep(server.latency * (1 + server.jitter * (2 * rng.random() - 1)))
+
+        if status == 429:
+            return self._send(429, {'status': 'error', 'message': 'rate limited'},
+                              {'Retry-After': str(server.retry_after)})
+        if status != 200:
+            return self._send(status, {'status': 'error', 'message': 'internal error'})
+
+        if url.path == NEWSDATA_PATH:
+            language = params.get('language', 'en')
+            size = int(params.get('size', 10))
+            # Cursor nextPage NewsData berupa token opak; di sini "p<nomor halaman>"
+            page = int(params.get('page', 'p1')[1:])
+            articles = server.articles(url.path, params.get('q', ''), language, size, page)
+            payload = {
+                'status': 'success',
+                'totalResults': len(articles) * server.pages,
+                'nextPage': f"p{page + 1}" if page < server.pages else None,
+                'results': [{
+                    'title': article['title'],
+                    'description': article['description'],
+                    'content': article['content'],
+                    'source_id': article['source'],
+                    'link': article['url'],
+                    'pubDate': article['publishedAt'].replace('T', ' ').rstrip('Z'),
+                    'image_url': None
+                } for article in articles]
+            }
+        else:
+            language = params.get('lang', 'en')
+            size = int(params.get('max', 10))
+            page = int(params.get('page', 1))
+            articles = server.articles(url.path, params.get('q', ''), language, size, page) if page <= server.pages else []
+            payload = {
+                'totalArticles': size * server.pages,
+                'articles': [{
+                    'title': article['title'],
+                    'description': article['description'],
+                    'content': article['content'],
+                    'url': article['url'],
+                    'image': None,
+                    'publishedAt': article['publishedAt'],
+                    'source': {'name': article['source'], 'url': ''}
+                } for article in articles]
+            }
+
+        self._send(200, payload)
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockNewsServer:
+    """Mock newsdata.io + gnews.io di 127.0.0.1 (port acak) dalam thread terpisah
+
+    latency: detik per request (± jitter relatif), error_rate: peluang HTTP 500,
+    throttle_rate: peluang HTTP 429 dengan header Retry-After, pages: jumlah
+    halaman per query (nextPage NewsData / parameter page GNews).
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=0, seed=0, port=0, pages=5):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.seed = seed
+        self.pages = pages
+        self.requests = 0
+        self._attempts = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_urls(self):
+        """Argumen base_urls untuk NewsAPIClient"""
+        return {'newsdata': self.base_url + NEWSDATA_PATH, 'gnews': self.base_url + GNEWS_PATH}
+
+    def request_rng(self, path, params):
+        """RNG untuk satu request dari (seed, path, parameter, percobaan ke-n untuk key itu)
+
+        Tidak bergantung pada urutan kedatangan request lain, jadi retry ke-n
+        untuk query yang sama selalu mendapat status & latensi yang sama.
+        """
+        key = f"{path}?{sorted(params.items())}"
+        with self._lock:
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+            self.requests += 1
+        return random.Random(zlib.crc32(f"{self.seed}|{key}|{attempt}".encode('utf-8')))
+
+    def roll(self, rng):
+        """Status HTTP untuk request dengan RNG dari request_rng"""
+        value = rng.random()
+        if value < self.throttle_rate:
+            return 429
+        if value < self.throttle_rate + self.error_rate:
+            return 500
+        return 200
+
+    def articles(self, endpoint, query, language, size, page=1):
+        seed = zlib.crc32(f"{self.seed}|{endpoint}|{query}|{language}|{page}".encode('utf-8'))
+        id_ratio = 1.0 if language == 'id' else 0.0
+        return list(iter_articles(size, seed=seed, id_ratio=id_ratio, topic=query))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,279 @@
+"""Jalankan benchmark engine sentiNews dan tulis hasilnya sebagai JSON
+
+Contoh:
+    python -m benchmarks --sizes 1000 10000 100000 -o hasil.json
+    python -m benchmarks --only aggregate_news --latency 0.2 --error-rate 0.1 --throttle-rate 0.05
+    python -m benchmarks --only aggregate_news --replay rekaman.jsonl.gz --replay-latency recorded
+
+Setiap hasil berisi throughput (artikel/detik), latensi p50/p99 (ms) dan
+puncak memori (MB, lewat tracemalloc pada run terpisah agar tidak
+memengaruhi waktu). Korpus & mock API memakai seed, jadi hasil antar commit
+bisa dibandingkan langsung.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from sentinews.analyzer import SentimentAnalyzer
+from sentinews.client import NewsAPIClient
+from sentinews.pipeline import aggregate_news, create_sentiment_summary
+from sentinews.replay import ProviderReplay
+from sentinews.sessions import HTTPSessionPool
+from sentinews.trends import TrendAggregator
+
+from .corpus import generate_articles
+from .mock_api import MockNewsServer
+
+BENCHMARKS = ['analyze', 'analyze_batch', 'create_sentiment_summary', 'trend', 'aggregate_news']
+
+# analyze() diukur per artikel; sampel dibatasi agar korpus besar tetap cepat
+ANALYZE_SAMPLE_MAX = 20000
+
+
+def percentile(samples, pct):
+    """Persentil nearest-rank dari daftar sampel"""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def measure(func, repeat):
+    """Waktu (detik) setiap ulangan func()"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def peak_memory_mb(func):
+    """Puncak alokasi Python selama satu kali func()"""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def retained_memory_mb(func):
+    """Alokasi Python yang masih dipegang hasil func() (mis. hasil di session state)"""
+    tracemalloc.start()
+    try:
+        value = func()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del value
+    return current / (1024 * 1024)
+
+
+def result(name, size, timings, latencies, peak_mb, items, **extra):
+    seconds = statistics.median(timings)
+    return {
+        'name': name,
+        'size': size,
+        'repeat': len(timings),
+        'seconds_median': round(seconds, 6),
+        'throughput_per_s': round(items / seconds, 1) if seconds else None,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'peak_mem_mb': round(peak_mb, 2),
+        **extra
+    }
+
+
+def bench_analyze(analyzer, articles, repeat):
+    texts = [f"{a['title']} {a['description']} {a['content']}" for a in articles[:ANALYZE_SAMPLE_MAX]]
+    latencies = []
+
+    def run():
+        for text in texts:
+            start = time.perf_counter()
+            analyzer.analyze(text)
+            latencies.append(time.perf_counter() - start)
+
+    timings = measure(run, repeat)
+    return result('analyze', len(articles), timings, latencies,
+                  peak_memory_mb(lambda: [analyzer.analyze(text) for text in texts[:1000]]),
+                  len(texts), sample=len(texts))
+
+
+def bench_analyze_batch(analyzer, articles, repeat, workers):
+    run = lambda: analyzer.analyze_batch(articles, workers=workers)
+    timings = measure(run, repeat)
+    # Yang disimpan UI/ResultCache: record ringkas tanpa konten penuh
+    retained = retained_memory_mb(lambda: [article.compact() for article in run()])
+    return result('analyze_batch', len(articles), timings, timings, peak_memory_mb(run),
+                  len(articles), workers=workers or os.cpu_count(), retained_mem_mb=round(retained, 2))
+
+
+def bench_summary(analyzer, articles, repeat):
+    analyzed = analyzer.analyze_batch(articles)
+    run = lambda: create_sentiment_summary(analyzed)
+    timings = measure(run, repeat)
+    return result('create_sentiment_summary', len(articles), timings, timings,
+                  peak_memory_mb(run), len(articles))
+
+
+def bench_trend(analyzer, articles, repeat):
+    """Trend per jam/hari + jendela geser dibangun ulang dari seluruh korpus (tervektorisasi)"""
+    analyzed = analyzer.analyze_batch(articles)
+    run = lambda: TrendAggregator.from_articles(analyzed)
+    run()  # impor pandas tidak ikut dihitung
+    timings = measure(run, repeat)
+    return result('trend', len(articles), timings, timings, peak_memory_mb(run), len(articles))
+
+
+def bench_aggregate_news(args, size):
+    """Pipeline fetch penuh terhadap mock API: satu run = satu topik baru"""
+    server_options = {
+        'latency': args.latency, 'jitter': args.jitter, 'error_rate': args.error_rate,
+        'throttle_rate': args.throttle_rate, 'seed': args.seed
+    }
+    latencies = []
+    article_counts = []
+
+    with MockNewsServer(**server_options) as server:
+        sessions = HTTPSessionPool()
+        client = NewsAPIClient(sessions=sessions, base_urls=server.base_urls)
+        round_number = [0]
+
+        def run():
+            round_number[0] += 1
+            start = time.perf_counter()
+            articles = aggregate_news(f"topic{round_number[0]}", 'both', size, client=client)
+            latencies.append(time.perf_counter() - start)
+            article_counts.append(len(articles))
+
+        run()  # warm-up koneksi keep-alive
+        peak = peak_memory_mb(run)
+        latencies.clear()
+        article_counts.clear()
+
+        timings = measure(run, args.fetch_rounds)
+        sessions.close()
+        requests_sent = server.requests
+
+    return result('aggregate_news', size, timings, latencies, peak,
+                  statistics.median(article_counts), server=server_options,
+                  http_requests=requests_sent)
+
+
+def bench_aggregate_replay(args, size):
+    """Pipeline penuh atas respons provider sungguhan yang direkam (--record)"""
+    latency = args.replay_latency
+    replay = ProviderReplay(args.replay, latency=latency if latency in (None, 'recorded') else float(latency))
+    client = NewsAPIClient(replay=replay)
+    queries = replay.queries()
+    if not queries:
+        raise SystemExit(f"{args.replay}: tidak ada rekaman")
+
+    latencies = []
+    round_number = [0]
+
+    def run():
+        query = queries[round_number[0] % len(queries)]
+        round_number[0] += 1
+        start = time.perf_counter()
+        aggregate_news(query, 'both', size, client=client)
+        latencies.append(time.perf_counter() - start)
+
+    peak = peak_memory_mb(run)
+    latencies.clear()
+    timings = measure(run, args.fetch_rounds)
+
+    return result('aggregate_news_replay', size, timings, latencies, peak, len(queries),
+                  recordings=len(replay), latency=latency)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='Ukuran korpus (1000 s.d. 1000000)')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, default=BENCHMARKS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1, help='Worker analyze_batch (0 = semua core)')
+    parser.add_argument('--fetch-rounds', type=int, default=5, help='Jumlah run aggregate_news')
+    parser.add_argument('--fetch-size', type=int, default=100, help='max_articles untuk aggregate_news')
+    parser.add_argument('--latency', type=float, default=0.05, help='Latensi mock API (detik)')
+    parser.add_argument('--jitter', type=float, default=0.2, help='Jitter relatif latensi mock API')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Peluang HTTP 500 dari mock API')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Peluang HTTP 429 dari mock API')
+    parser.add_argument('--replay', metavar='FILE',
+                        help='aggregate_news atas file rekaman provider, bukan mock API')
+    parser.add_argument('--replay-latency', default=None,
+                        help="Latensi simulasi saat replay: detik tetap atau 'recorded'")
+    parser.add_argument('-o', '--output', default='-', help='File JSON hasil (default: stdout)')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    analyzer = SentimentAnalyzer()
+    results = []
+
+    corpus_benchmarks = [name for name in args.only if name != 'aggregate_news']
+
+    for size in args.sizes if corpus_benchmarks else []:
+        articles = generate_articles(size, seed=args.seed)
+        print(f"korpus {size} artikel", file=sys.stderr)
+
+        if 'analyze' in args.only:
+            results.append(bench_analyze(analyzer, articles, args.repeat))
+        if 'analyze_batch' in args.only:
+            results.append(bench_analyze_batch(analyzer, articles, args.repeat, args.workers or None))
+        if 'create_sentiment_summary' in args.only:
+            results.append(bench_summary(analyzer, articles, args.repeat))
+        if 'trend' in args.only:
+            results.append(bench_trend(analyzer, articles, args.repeat))
+
+    if 'aggregate_news' in args.only:
+        if args.replay:
+            results.append(bench_aggregate_replay(args, args.fetch_size))
+        else:
+            results.append(bench_aggregate_news(args, args.fetch_size))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'seed': args.seed
+        },
+        'results': results
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+
+    return 0
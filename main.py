@@ -1,290 +1,32 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
+import heapq
+import os
 import time
 from collections import Counter
-import requests
 
-# ============================================================================
-# SENTIMENT ANALYZER CLASS
-# ============================================================================
-class SentimentAnalyzer:
-    """Analisis sentimen menggunakan keyword-based approach"""
-    
-    def __init__(self):
-        # Kata-kata positif dalam bahasa Indonesia dan Inggris
-        self.positive_words_id = [
-            'naik', 'meningkat', 'positif', 'untung', 'profit', 'bagus', 'baik',
-            'optimis', 'bullish', 'rally', 'menguat', 'cemerlang', 'peluang',
-            'potensi', 'keuntungan', 'surplus', 'tumbuh', 'berkembang', 'maju',
-            'sukses', 'hebat', 'luar biasa', 'fantastis', 'menggembirakan',
-            'menjanjikan', 'kuat', 'solid', 'stabil', 'aman', 'percaya diri'
-        ]
-        
-        self.positive_words_en = [
-            'surge', 'gain', 'rise', 'up', 'higher', 'growth', 'increase',
-            'boost', 'strong', 'recover', 'soar', 'jump', 'rally', 'bullish',
-            'positive', 'profit', 'good', 'great', 'excellent', 'outstanding',
-            'impressive', 'promising', 'optimistic', 'confident', 'solid',
-            'stable', 'secure', 'success', 'win', 'breakthrough', 'advance'
-        ]
-        
-        # Kata-kata negatif dalam bahasa Indonesia dan Inggris
-        self.negative_words_id = [
-            'turun', 'menurun', 'negatif', 'rugi', 'loss', 'buruk', 'jelek',
-            'pesimis', 'bearish', 'crash', 'anjlok', 'melemah', 'risiko',
-            'bahaya', 'krisis', 'kerugian', 'defisit', 'gagal', 'mundur',
-            'jatuh', 'tertekan', 'lemah', 'khawatir', 'takut', 'panik',
-            'masalah', 'kesulitan', 'hambatan', 'kendala', 'ancaman'
-        ]
-        
-        self.negative_words_en = [
-            'drop', 'fall', 'down', 'lower', 'decline', 'decrease', 'plunge',
-            'weak', 'slump', 'tumble', 'bearish', 'negative', 'loss', 'bad',
-            'poor', 'terrible', 'awful', 'disappointing', 'concerning',
-            'worrying', 'risk', 'danger', 'crisis', 'fail', 'problem',
-            'difficulty', 'obstacle', 'threat', 'fear', 'panic', 'crash'
-        ]
-        
-        self.all_positive = self.positive_words_id + self.positive_words_en
-        self.all_negative = self.negative_words_id + self.negative_words_en
-    
-    def analyze(self, text):
-        """Analisis sentimen dari teks"""
-        if not text:
-            return 'neutral', 0, {'positive': [], 'negative': []}
-        
-        text_lower = text.lower()
-        
-        # Hitung kata-kata positif dan negatif yang ditemukan
-        positive_matches = [word for word in self.all_positive if word in text_lower]
-        negative_matches = [word for word in self.all_negative if word in text_lower]
-        
-        positive_count = len(positive_matches)
-        negative_count = len(negative_matches)
-        
-        total_sentiment_words = positive_count + negative_count
-        
-        # Tentukan sentimen
-        if total_sentiment_words == 0:
-            sentiment = 'neutral'
-            confidence = 0
-        elif positive_count > negative_count:
-            sentiment = 'positive'
-            confidence = (positive_count / total_sentiment_words) * 100
-        elif negative_count > positive_count:
-            sentiment = 'negative'
-            confidence = (negative_count / total_sentiment_words) * 100
-        else:
-            sentiment = 'neutral'
-            confidence = 50
-        
-        keyword_matches = {
-            'positive': positive_matches[:5],
-            'negative': negative_matches[:5]
-        }
-        
-        return sentiment, round(confidence, 1), keyword_matches
-    
-    def analyze_batch(self, articles):
-        """Analisis sentimen untuk banyak artikel sekaligus"""
-        analyzed = []
-        
-        for article in articles:
-            text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}"
-            sentiment, confidence, keywords = self.analyze(text)
-            
-            analyzed.append({
-                **article,
-                'sentiment': sentiment,
-                'confidence': confidence,
-                'keywords': keywords
-            })
-        
-        return analyzed
-
-
-# ============================================================================
-# NEWS API CLIENT CLASS
-# ============================================================================
-class NewsAPIClient:
-    """Client untuk berbagai News API gratis"""
-    
-    def __init__(self):
-        # ========================================================================
-        # API KEYS - SUDAH DIISI
-        # ========================================================================
-        
-        self.newsdata_key = "pub_cde750ce48074b45a714654be4063bf4"
-        self.gnews_key = "20279dd1f36d7ad62d50144631657942"
-        
-    def fetch_newsdata_io(self, query, language='en', max_results=50):
-        """NewsData.io API - Free tier: 200 requests/day"""
-        url = "https://newsdata.io/api/1/news"
-        
-        params = {
-            'apikey': self.newsdata_key,
-            'q': query,
-            'language': language,
-            'size': min(max_results, 50)
-        }
-        
-        try:
-            response = requests.get(url, params=params, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                articles = []
-                
-                if data.get('status') == 'success' and 'results' in data:
-                    for item in data['results']:
-                        articles.append({
-                            'title': item.get('title', ''),
-                            'description': item.get('description', ''),
-                            'content': item.get('content', ''),
-                            'source': item.get('source_id', 'Unknown'),
-                            'url': item.get('link', ''),
-                            'publishedAt': item.get('pubDate', ''),
-                            'image': item.get('image_url', '')
-                        })
-                
-                return articles
-            else:
-                return []
-                
-        except Exception as e:
-            st.warning(f"NewsData.io: {str(e)[:50]}")
-            return []
-    
-    def fetch_gnews(self, query, language='en', country=None, max_results=50):
-        """GNews API - Free tier: 100 requests/day"""
-        url = "https://gnews.io/api/v4/search"
-        
-        params = {
-            'q': query,
-            'lang': language,
-            'max': min(max_results, 100),
-            'apikey': self.gnews_key
-        }
-        
-        if country:
-            params['country'] = country
-        
-        try:
-            response = requests.get(url, params=params, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                articles = []
-                
-                if 'articles' in data:
-                    for item in data['articles']:
-                        articles.append({
-                            'title': item.get('title', ''),
-                            'description': item.get('description', ''),
-                            'content': item.get('content', ''),
-                            'source': item.get('source', {}).get('name', 'Unknown'),
-                            'url': item.get('url', ''),
-                            'publishedAt': item.get('publishedAt', ''),
-                            'image': item.get('image', '')
-                        })
-                
-                return articles
-            else:
-                return []
-                
-        except Exception as e:
-            st.warning(f"GNews: {str(e)[:50]}")
-            return []
-
-
-# ============================================================================
-# HELPER FUNCTIONS
-# ============================================================================
-def aggregate_news(query, news_type='both', max_articles=100):
-    """Mengumpulkan berita dari berbagai sumber API"""
-    client = NewsAPIClient()
-    all_articles = []
-    
-    if news_type in ['international', 'both']:
-        # Ambil dari NewsData.io (English)
-        articles1 = client.fetch_newsdata_io(query, language='en', max_results=50)
-        all_articles.extend(articles1)
-        time.sleep(0.5)
-        
-        # Ambil dari GNews (English)
-        articles2 = client.fetch_gnews(query, language='en', max_results=50)
-        all_articles.extend(articles2)
-        time.sleep(0.5)
-    
-    if news_type in ['local', 'both']:
-        # Ambil dari GNews (Indonesia)
-        articles3 = client.fetch_gnews(query, language='id', country='id', max_results=50)
-        all_articles.extend(articles3)
-        time.sleep(0.5)
-        
-        # Ambil dari NewsData.io (Indonesia)
-        articles4 = client.fetch_newsdata_io(query, language='id', max_results=50)
-        all_articles.extend(articles4)
-    
-    # Hapus duplikat
-    seen_titles = set()
-    unique_articles = []
-    
-    for article in all_articles:
-        title = article.get('title', '').strip()
-        if title and title not in seen_titles:
-            seen_titles.add(title)
-            unique_articles.append(article)
-    
-    return unique_articles[:max_articles]
-
-
-def create_sentiment_summary(analyzed_articles):
-    """Membuat ringkasan sentimen"""
-    if not analyzed_articles:
-        return None
-    
-    total = len(analyzed_articles)
-    sentiments = [a['sentiment'] for a in analyzed_articles]
-    
-    positive_count = sentiments.count('positive')
-    negative_count = sentiments.count('negative')
-    neutral_count = sentiments.count('neutral')
-    
-    positive_pct = (positive_count / total) * 100
-    negative_pct = (negative_count / total) * 100
-    neutral_pct = (neutral_count / total) * 100
-    
-    if positive_pct > negative_pct + 15:
-        overall_trend = "SANGAT POSITIF"
-        trend_emoji = "📈🚀"
-    elif positive_pct > negative_pct + 5:
-        overall_trend = "POSITIF"
-        trend_emoji = "📈"
-    elif negative_pct > positive_pct + 15:
-        overall_trend = "SANGAT NEGATIF"
-        trend_emoji = "📉💔"
-    elif negative_pct > positive_pct + 5:
-        overall_trend = "NEGATIF"
-        trend_emoji = "📉"
-    else:
-        overall_trend = "NETRAL"
-        trend_emoji = "➡️"
-    
-    avg_confidence = sum(a.get('confidence', 0) for a in analyzed_articles) / total if total > 0 else 0
-    
-    return {
-        'total': total,
-        'positive_count': positive_count,
-        'negative_count': negative_count,
-        'neutral_count': neutral_count,
-        'positive_pct': positive_pct,
-        'negative_pct': negative_pct,
-        'neutral_pct': neutral_pct,
-        'overall_trend': overall_trend,
-        'trend_emoji': trend_emoji,
-        'avg_confidence': avg_confidence
-    }
+from sentinews.analyzer import SentimentAnalyzer
+from sentinews.cache import ResponseCache
+from sentinews.client import NewsAPIClient
+from sentinews.dedup import NearDuplicateDetector
+from sentinews.export import EXPORT_FORMATS, available_formats, build_report, export_articles
+from sentinews.metrics import METRICS_HOST, STAGE_SECONDS, stage, start_metrics_server
+from sentinews.pipeline import (DEEP_FETCH_MAX_PAGES, SentimentAggregator, create_sentiment_summary,
+                                plan_provider_calls, stream_scored_batches)
+from sentinews.planner import ProviderPlanner
+from sentinews.prewarm import PREWARM_QUOTA_SHARE, PrewarmScheduler, watchlist_result_key
+from sentinews.quota import QuotaScheduler
+from sentinews.replay import ProviderRecorder, ProviderReplay
+from sentinews.results import ResultCache
+from sentinews.sessions import HTTPSessionPool
+from sentinews.store import ArticleStore
+from sentinews.topics import PRESET_TOPICS, TICKER_ALIASES
+from sentinews.trends import TrendAggregator, published_epochs
+from sentinews.watchlist import analyze_watchlist, watchlist_table
 
+# Jumlah expander berita per halaman di setiap tab
+ARTICLES_PER_PAGE = 10
 
 # ============================================================================
 # STREAMLIT APP
@@ -341,11 +83,244 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_response_cache():
+    """Cache respons bersama untuk semua rerun & sesi Streamlit"""
+    return ResponseCache()
+
+
+@st.cache_resource
+def get_http_sessions():
+    """Pool koneksi HTTP bersama untuk semua rerun & sesi Streamlit"""
+    return HTTPSessionPool()
+
+
+@st.cache_resource
+def get_result_cache():
+    """Hasil analisis jadi (LRU + TTL) yang dibagi semua sesi Streamlit"""
+    return ResultCache()
+
+
+@st.cache_resource
+def get_quota_scheduler():
+    """Penjadwal kuota provider bersama untuk semua rerun & sesi Streamlit"""
+    return QuotaScheduler()
+
+
+@st.cache_resource
+def get_provider_planner():
+    """Riwayat yield & latensi per panggilan provider, bersama untuk semua sesi"""
+    return ProviderPlanner()
+
+
+@st.cache_resource
+def get_article_store():
+    """Arsip artikel terskor bersama untuk semua rerun & sesi Streamlit"""
+    return ArticleStore()
+
+
+@st.cache_resource
+def get_provider_tap():
+    """(recorder, replay) dari SENTINEWS_RECORD_FILE / SENTINEWS_REPLAY_FILE, bila diisi"""
+    record_file = os.environ.get('SENTINEWS_RECORD_FILE')
+    replay_file = os.environ.get('SENTINEWS_REPLAY_FILE')
+    return (ProviderRecorder(record_file) if record_file else None,
+            ProviderReplay(replay_file) if replay_file else None)
+
+
+def make_client():
+    """NewsAPIClient dengan cache, pool koneksi & kuota bersama"""
+    recorder, replay = get_provider_tap()
+    if replay is not None:
+        # Mode replay: respons rekaman saja, tanpa cache maupun kuota
+        return NewsAPIClient(sessions=get_http_sessions(), replay=replay)
+    return NewsAPIClient(cache=get_response_cache(), sessions=get_http_sessions(),
+                         quota=get_quota_scheduler(), recorder=recorder)
+
+
+@st.cache_resource
+def get_prewarmer():
+    """Pemanas hasil preset & watchlist di background (SENTINEWS_PREWARM=0 untuk mematikan)
+
+    SENTINEWS_PREWARM_TICKERS: ticker watchlist yang dipanaskan, dipisah koma
+    (default semua ticker). SENTINEWS_PREWARM_SHARE: bagian kuota harian
+    provider untuk pemanasan (default PREWARM_QUOTA_SHARE).
+    """
+    if os.environ.get('SENTINEWS_PREWARM', '1') == '0' or get_provider_tap()[1] is not None:
+        return None
+    
+    tickers = os.environ.get('SENTINEWS_PREWARM_TICKERS')
+    tickers = [ticker.strip().upper() for ticker in tickers.split(',') if ticker.strip()] \
+        if tickers is not None else list(TICKER_ALIASES)
+    return PrewarmScheduler(make_client, get_result_cache(), topics=PRESET_TOPICS.values(),
+                            tickers=[ticker for ticker in tickers if ticker in TICKER_ALIASES],
+                            analyzer=SentimentAnalyzer(), store=get_article_store(),
+                            share=float(os.environ.get('SENTINEWS_PREWARM_SHARE', PREWARM_QUOTA_SHARE))).start()
+
+
+@st.cache_resource
+def get_metrics_server():
+    """Endpoint /metrics (format Prometheus) bila SENTINEWS_METRICS_PORT diisi
+
+    Hanya di localhost kecuali SENTINEWS_METRICS_HOST diisi (mis. 0.0.0.0 agar
+    bisa di-scrape dari luar host).
+    """
+    port = os.environ.get('SENTINEWS_METRICS_PORT')
+    host = os.environ.get('SENTINEWS_METRICS_HOST', METRICS_HOST)
+    return start_metrics_server(int(port), host) if port else None
+
+
+def render_metrics(summary):
+    """Empat metric ringkasan sentimen"""
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📰 Total Berita", summary['total'])
+    
+    with col2:
+        st.metric("😊 Positif", f"{summary['positive_pct']:.1f}%",
+                 delta=f"{summary['positive_count']} berita")
+    
+    with col3:
+        st.metric("😟 Negatif", f"{summary['negative_pct']:.1f}%",
+                 delta=f"{summary['negative_count']} berita", delta_color="inverse")
+    
+    with col4:
+        st.metric("😐 Netral", f"{summary['neutral_pct']:.1f}%",
+                 delta=f"{summary['neutral_count']} berita", delta_color="off")
+
+
+def render_sentiment_chart(summary):
+    """Bar chart jumlah berita per sentimen"""
+    chart_data = pd.DataFrame({
+        'Sentimen': ['Positif', 'Negatif', 'Netral'],
+        'Jumlah': [summary['positive_count'], summary['negative_count'], summary['neutral_count']]
+    })
+    
+    st.bar_chart(chart_data.set_index('Sentimen')['Jumlah'])
+
+
+def render_trend(trend):
+    """Jendela 1 jam / 24 jam terakhir & grafik momentum sentimen per jam/hari"""
+    col1, col2, col3 = st.columns([1, 1, 2])
+    
+    for col, label, title in ((col1, '1h', "🕐 1 Jam Terakhir"), (col2, '24h', "📅 24 Jam Terakhir")):
+        counts = trend.window(label)
+        with col:
+            st.metric(title, f"{counts['total']} berita",
+                      delta=f"{counts['positive'] - counts['negative']:+d} bersih")
+    
+    with col3:
+        granularity = st.radio("Interval", ['hour', 'day'], horizontal=True, key='trend_granularity',
+                               format_func={'hour': "Per Jam", 'day': "Per Hari"}.get)
+    
+    frame = trend.frame(granularity)
+    if frame.empty:
+        st.info("Waktu terbit berita tidak tersedia")
+        return
+    
+    st.line_chart(frame[['net', 'momentum']].rename(columns={'net': 'Skor Bersih', 'momentum': 'Momentum'}))
+    st.bar_chart(
+        frame[['positive', 'negative', 'neutral']].rename(
+            columns={'positive': 'Positif', 'negative': 'Negatif', 'neutral': 'Netral'}
+        ),
+        color=['#28a745', '#dc3545', '#ffc107']
+    )
+    if trend.undated:
+        st.caption(f"{trend.undated} berita tanpa waktu terbit tidak ikut dihitung")
+
+
+def render_live_results(summary, analyzed_articles, trend=None, max_display=10):
+    """Hasil sementara selama provider lain masih berjalan (tanpa widget interaktif)"""
+    st.markdown(f"#### {summary['trend_emoji']} Sementara: {summary['overall_trend']}")
+    render_metrics(summary)
+    render_sentiment_chart(summary)
+    
+    if trend is not None:
+        last_hour, last_day = trend.window('1h'), trend.window('24h')
+        st.caption(f"🕐 1 jam terakhir: {last_hour['total']} berita "
+                   f"({last_hour['positive'] - last_hour['negative']:+d} bersih) · "
+                   f"📅 24 jam terakhir: {last_day['total']} berita "
+                   f"({last_day['positive'] - last_day['negative']:+d} bersih)")
+    
+    tabs = st.tabs([
+        f"😊 Positif ({summary['positive_count']})",
+        f"😟 Negatif ({summary['negative_count']})",
+        f"😐 Netral ({summary['neutral_count']})"
+    ])
+    
+    for tab, sentiment in zip(tabs, ['positive', 'negative', 'neutral']):
+        with tab:
+            titles = [a['title'] for a in analyzed_articles if a['sentiment'] == sentiment][:max_display]
+            st.markdown("\n".join(f"- {title[:100]}" for title in titles) or "_Belum ada berita_")
+
+
+def get_article_groups(analyzed_articles):
+    """Indeks artikel per sentimen & sumber, dihitung sekali per hasil analisis"""
+    cached = st.session_state.get('article_groups')
+    if cached is not None and cached[0] is analyzed_articles:
+        return cached[1]
+    
+    by_sentiment = {'positive': {}, 'negative': {}, 'neutral': {}}
+    for idx, article in enumerate(analyzed_articles):
+        by_sentiment[article['sentiment']].setdefault(article['source'], []).append(idx)
+    
+    groups = {
+        'by_sentiment': by_sentiment,
+        'sources': sorted({source for sources in by_sentiment.values() for source in sources})
+    }
+    st.session_state.article_groups = (analyzed_articles, groups)
+    return groups
+
+
+def get_trend(analyzed_articles, topic):
+    """Trend per waktu untuk hasil ini: seluruh arsip topik bila lebih lengkap, selain itu hasilnya saja"""
+    cached = st.session_state.get('trend')
+    if cached is not None and cached[0] is analyzed_articles and cached[1] == topic:
+        trend = cached[2]
+        trend.advance()
+        return trend
+    
+    published, sentiments = get_article_store().timeline(topic)
+    if len(published) >= len(analyzed_articles):
+        trend = TrendAggregator.from_arrays(published_epochs(published), sentiments)
+    else:
+        trend = TrendAggregator.from_articles(analyzed_articles)
+    
+    st.session_state.trend = (analyzed_articles, topic, trend)
+    return trend
+
+
+def get_export_memo(analyzed_articles, topic):
+    """Tempat menyimpan file export yang sudah dibuat untuk hasil analisis ini"""
+    cached = st.session_state.get('exports')
+    if cached is not None and cached[0] is analyzed_articles and cached[1] == topic:
+        return cached[2]
+    
+    exports = {}
+    st.session_state.exports = (analyzed_articles, topic, exports)
+    return exports
+
+
+def memoized_export(exports, key, build):
+    """File export dari memo, dibuat dengan build() hanya bila belum ada"""
+    if key not in exports:
+        exports[key] = build()
+    return exports[key]
+
+
+get_metrics_server()
+get_prewarmer()
+
 # Session State
 if 'analyzed_articles' not in st.session_state:
     st.session_state.analyzed_articles = None
 if 'summary' not in st.session_state:
     st.session_state.summary = None
+if 'fetch_log' not in st.session_state:
+    st.session_state.fetch_log = []
+if 'watchlist' not in st.session_state:
+    st.session_state.watchlist = None
 
 # Header
 st.markdown("""
@@ -360,16 +335,7 @@ with st.sidebar:
     st.markdown("### ⚙️ Pengaturan Analisis")
     
     # Preset topics
-    preset_topics = {
-        "Custom": "",
-        "Bitcoin (BTC)": "BTC Bitcoin",
-        "Ripple (XRP)": "XRP Ripple",
-        "Ethereum (ETH)": "ETH Ethereum",
-        "Aneka Tambang (ANTM)": "ANTM Aneka Tambang",
-        "Telkom (TLKM)": "TLKM Telkom Indonesia",
-        "Bank BRI (BBRI)": "BBRI Bank BRI",
-        "Bank BCA (BBCA)": "BBCA Bank BCA"
-    }
+    preset_topics = {"Custom": "", **PRESET_TOPICS}
     
     selected_preset = st.selectbox(
         "Pilih Preset atau Custom",
@@ -385,6 +351,15 @@ with st.sidebar:
     else:
         topic = preset_topics[selected_preset]
         st.info(f"📌 Topik: **{selected_preset}**")
+    warm_placeholder = st.empty()
+    
+    watchlist_mode = st.checkbox("📋 Mode Watchlist (banyak ticker sekaligus)")
+    if watchlist_mode:
+        watchlist_tickers = st.multiselect(
+            "Ticker Watchlist",
+            list(TICKER_ALIASES.keys()),
+            default=list(TICKER_ALIASES.keys())
+        )
     
     st.markdown("---")
     
@@ -411,9 +386,33 @@ with st.sidebar:
             step=10
         )
         
+        deep_fetch = st.checkbox(
+            "Deep Fetch (ikuti halaman berikutnya)",
+            help=f"Hingga {DEEP_FETCH_MAX_PAGES} halaman per provider sampai jumlah berita tercapai; "
+                 f"memakai kuota lebih banyak"
+        )
+        max_pages = DEEP_FETCH_MAX_PAGES if deep_fetch else 1
+        
+        local_first = st.checkbox(
+            "Jawab dari Arsip Lokal",
+            value=True,
+            help="Bila arsip berita sudah cukup segar & lengkap untuk topik ini, "
+                 "tampilkan tanpa memanggil API (hemat kuota & waktu)"
+        )
+        
         show_confidence = st.checkbox("Tampilkan Confidence Score", value=True)
         show_keywords = st.checkbox("Tampilkan Keyword Matches", value=True)
     
+    # Hasil yang sudah siap (dipanaskan di background atau dari sesi lain) tampil instan
+    if watchlist_mode:
+        warm_key = watchlist_result_key(watchlist_tickers, news_type, max_articles)
+    else:
+        warm_key = ResultCache.make_key(topic, news_type, max_articles, max_pages, local_first) if topic else None
+    warm = get_result_cache().get(warm_key) if warm_key else None
+    if warm is not None:
+        warm_placeholder.caption(f"{'🔥 Data hangat' if 'warmed_at' in warm[0] else '⚡ Hasil siap'} · "
+                                 f"diperbarui {warm[1] / 60:.0f} menit lalu")
+    
     st.markdown("---")
     
     analyze_button = st.button("🚀 MULAI ANALISIS", type="primary")
@@ -431,14 +430,73 @@ with st.sidebar:
     
     Total: ~300 requests/hari
     """)
+    
+    st.markdown("### 🎫 Sisa Kuota Hari Ini")
+    for provider, quota in get_quota_scheduler().status().items():
+        st.progress(quota['remaining'] / quota['limit'],
+                    text=f"{provider}: {quota['remaining']}/{quota['limit']} request")
+    
+    with st.expander("📦 Cache Respons"):
+        cache_stats = get_response_cache().stats()
+        st.markdown(f"""
+        - Hit: **{cache_stats['hits']}** | Miss: **{cache_stats['misses']}**
+        - Hit rate: **{cache_stats['hit_rate']:.0f}%**
+        - Entri tersimpan: **{cache_stats['entries']}**
+        - TTL: **{get_response_cache().ttl // 60:.0f} menit**
+        """)
+        result_stats = get_result_cache().stats()
+        st.caption(f"Hasil bersama antar sesi: {result_stats['entries']} entri · "
+                   f"{result_stats['hits']} hit · {result_stats['coalesced']} request digabung")
+        prewarmer = get_prewarmer()
+        if prewarmer is not None:
+            warmed = sum(1 for job in prewarmer.jobs.values() if job['status'] == 'ok')
+            st.caption(f"Pemanasan background: {warmed}/{len(prewarmer.topics) + bool(prewarmer.tickers)} "
+                       f"hasil hangat" + (f" · backoff ×{prewarmer.failures + 1}" if prewarmer.failures else "")
+                       + (" · kuota tidak cukup untuk menyegarkan tiap jam" if prewarmer.unsupported else ""))
+        if st.button("🗑️ Kosongkan Cache"):
+            get_response_cache().clear()
 
 # Main Content
-if analyze_button:
+if analyze_button and watchlist_mode:
+    if not watchlist_tickers:
+        st.warning("⚠️ Mohon pilih minimal satu ticker!")
+    else:
+        with st.spinner(f"📡 Menganalisis watchlist: {', '.join(watchlist_tickers)}..."):
+            start_time = time.time()
+            
+            def run_watchlist():
+                # Satu set query OR gabungan untuk semua ticker
+                client = make_client()
+                watchlist = analyze_watchlist(watchlist_tickers, news_type, max_articles, client=client)
+                return {**watchlist, 'fetch_log': client.fetch_log}
+            
+            # compute() dibagi antar sesi, jadi tanpa pemanggilan Streamlit di dalamnya
+            watchlist, result_status, result_age = get_result_cache().get_or_compute(
+                watchlist_result_key(watchlist_tickers, news_type, max_articles), run_watchlist
+            )
+            if result_status != ResultCache.HIT:
+                for entry in watchlist['fetch_log']:
+                    if entry['status'] == 'error':
+                        st.warning(f"{entry['provider']} ({entry['language']}): {entry['error']}")
+            st.session_state.watchlist = watchlist
+            st.session_state.fetch_log = watchlist['fetch_log']
+            st.session_state.summary = None
+            st.session_state.analyzed_articles = None
+        
+        if result_status == ResultCache.HIT and 'warmed_at' in watchlist:
+            st.success(f"🔥 Data hangat dari {result_age / 60:.0f} menit lalu (diperbarui di background)")
+        elif result_status == ResultCache.HIT:
+            st.success(f"⚡ Hasil bersama dari {result_age / 60:.1f} menit lalu")
+        else:
+            st.success(f"✅ Watchlist selesai dalam {time.time() - start_time:.1f} detik!")
+
+elif analyze_button:
     if not topic:
         st.warning("⚠️ Mohon masukkan topik/ticker!")
     else:
         progress_placeholder = st.empty()
         status_placeholder = st.empty()
+        live_placeholder = st.empty()
         
         with progress_placeholder.container():
             st.markdown(f"### 🔍 Menganalisis: **{topic.upper()}**")
@@ -449,44 +507,107 @@ if analyze_button:
             
             start_time = time.time()
             
-            # Fetch news
-            all_articles = aggregate_news(topic, news_type, max_articles)
-            progress_bar.progress(40)
-            
-            if not all_articles:
-                status_placeholder.error("❌ Tidak ada berita ditemukan")
-                progress_bar.empty()
-            else:
-                status_placeholder.success(f"✅ {len(all_articles)} berita dikumpulkan")
-                time.sleep(0.3)
+            def run_analysis():
+                # Fetch news (respons identik dilayani dari cache); setiap batch
+                # provider langsung diskor & dirender tanpa menunggu provider lain
+                client = make_client()
+                # Replay: request harus sama persis dengan rekaman, jadi tanpa fetch inkremental
+                store = get_article_store() if client.replay is None else None
+                detector = NearDuplicateDetector()
+                aggregator = SentimentAggregator(detector)
+                trend = TrendAggregator()
+                analyzer = SentimentAnalyzer()
+                analyzed_articles = []
                 
-                # Analyze sentiment
-                status_placeholder.info("🤖 Menganalisis sentimen...")
-                progress_bar.progress(60)
+                total_calls = len(plan_provider_calls(client, topic, news_type))
+                batches = stream_scored_batches(topic, news_type, max_articles, client=client,
+                                                analyzer=analyzer, detector=detector, max_pages=max_pages,
+                                                planner=get_provider_planner(), store=store,
+                                                local_first=local_first)
                 
-                analyzer = SentimentAnalyzer()
-                analyzed_articles = analyzer.analyze_batch(all_articles)
+                for done, (label, scored) in enumerate(batches, 1):
+                    analyzed_articles.extend(trend.consume(aggregator.consume(scored)))
+                    # Deep fetch bisa menghasilkan lebih banyak batch daripada panggilan awal
+                    progress = max(min(done / total_calls, 1.0), len(analyzed_articles) / max_articles)
+                    progress_bar.progress(10 + int(80 * min(progress, 1.0)))
+                    status_placeholder.info(f"📡 {label}: {len(scored)} berita baru "
+                                            f"({len(analyzed_articles)}/{max_articles} berita)")
+                    
+                    if analyzed_articles:
+                        with live_placeholder.container(), stage('render'):
+                            render_live_results(aggregator.summary(), analyzed_articles, trend)
+                
+                for entry in client.fetch_log:
+                    if entry['status'] == 'error':
+                        st.warning(f"{entry['provider']} ({entry['language']}): {entry['error']}")
                 
-                progress_bar.progress(80)
+                if not analyzed_articles:
+                    return None
                 
                 # Create summary
                 status_placeholder.info("📊 Membuat ringkasan...")
                 summary = create_sentiment_summary(analyzed_articles)
                 
+                return {
+                    'analyzed_articles': analyzed_articles,
+                    'summary': summary,
+                    'fetch_log': client.fetch_log
+                }
+            
+            # Sesi lain yang meminta topik yang sama berbagi satu fetch & hasil
+            result, result_status, result_age = get_result_cache().get_or_compute(
+                ResultCache.make_key(topic, news_type, max_articles, max_pages, local_first), run_analysis
+            )
+            
+            if result is None:
+                status_placeholder.error("❌ Tidak ada berita ditemukan")
+                progress_bar.empty()
+            else:
                 progress_bar.progress(100)
                 
-                st.session_state.analyzed_articles = analyzed_articles
-                st.session_state.summary = summary
+                st.session_state.analyzed_articles = result['analyzed_articles']
+                st.session_state.summary = result['summary']
+                st.session_state.fetch_log = result['fetch_log']
+                st.session_state.watchlist = None
                 
                 elapsed_time = time.time() - start_time
-                status_placeholder.success(f"✅ Selesai dalam {elapsed_time:.1f} detik!")
-                time.sleep(1)
+                if result_status == ResultCache.HIT and 'warmed_at' in result:
+                    status_placeholder.success(f"🔥 Data hangat dari {result_age / 60:.0f} menit lalu "
+                                               f"(diperbarui di background, {elapsed_time:.2f} detik)")
+                elif result_status == ResultCache.HIT:
+                    status_placeholder.success(f"⚡ Hasil bersama dari {result_age / 60:.1f} menit lalu "
+                                               f"({elapsed_time:.2f} detik)")
+                elif result_status == ResultCache.COALESCED:
+                    status_placeholder.success(f"🤝 Bergabung dengan analisis sesi lain, "
+                                               f"selesai dalam {elapsed_time:.1f} detik!")
+                else:
+                    status_placeholder.success(f"✅ Selesai dalam {elapsed_time:.1f} detik!")
                 
         progress_placeholder.empty()
-        status_placeholder.empty()
+        live_placeholder.empty()
+
+# Watchlist Results
+if st.session_state.watchlist:
+    watchlist = st.session_state.watchlist
+    
+    st.markdown("### 📋 Ringkasan Watchlist")
+    st.dataframe(pd.DataFrame(watchlist_table(watchlist['summaries'])),
+                 hide_index=True, use_container_width=True)
+    st.caption(f"📡 {watchlist['calls']} panggilan provider untuk {len(watchlist['summaries'])} ticker "
+               f"· {watchlist['unmatched']} berita tidak menyebut ticker mana pun")
+    
+    available_tickers = [ticker for ticker, summary in watchlist['summaries'].items() if summary]
+    if available_tickers:
+        detail_ticker = st.selectbox("🔎 Lihat Detail Ticker", available_tickers)
+        st.session_state.summary = watchlist['summaries'][detail_ticker]
+        st.session_state.analyzed_articles = watchlist['articles'][detail_ticker]
+        topic = detail_ticker
+    
+    st.markdown("---")
 
 # Display Results
 if st.session_state.summary and st.session_state.analyzed_articles:
+    render_start = time.perf_counter()
     summary = st.session_state.summary
     analyzed_articles = st.session_state.analyzed_articles
     
@@ -501,36 +622,40 @@ if st.session_state.summary and st.session_state.analyzed_articles:
         </div>
     """, unsafe_allow_html=True)
     
+    if summary.get('duplicates_removed'):
+        st.caption(f"🔁 {summary['duplicate_clusters']} klaster berita duplikat/syndicated digabung "
+                   f"({summary['duplicates_removed']} salinan tidak dihitung ulang)")
+    
+    if st.session_state.fetch_log:
+        with st.expander("📦 Detail Fetch & Cache"):
+            for entry in st.session_state.fetch_log:
+                age_min = entry['age'] / 60
+                status = {
+                    'hit': f"✅ Cache HIT (umur {age_min:.1f} menit)",
+                    'stale': f"♻️ Cache STALE, hemat kuota (umur {age_min:.1f} menit)",
+                    'miss': "🌐 Cache MISS (request baru)",
+                    'denied': "⛔ Ditolak, kuota habis",
+                    'error': f"⚠️ Gagal: {entry.get('error')}",
+                    'skipped': f"⏭️ Dilewati, {entry.get('error')}"
+                }[entry['status']]
+                timing = f" · {entry['seconds']:.2f} detik" if entry.get('seconds') else ""
+                st.markdown(f"- **{entry['provider']}** ({entry['language']}): "
+                            f"{entry['count']} berita — {status}{timing}")
+    
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("📰 Total Berita", summary['total'])
-    
-    with col2:
-        st.metric("😊 Positif", f"{summary['positive_pct']:.1f}%",
-                 delta=f"{summary['positive_count']} berita")
-    
-    with col3:
-        st.metric("😟 Negatif", f"{summary['negative_pct']:.1f}%",
-                 delta=f"{summary['negative_count']} berita", delta_color="inverse")
-    
-    with col4:
-        st.metric("😐 Netral", f"{summary['neutral_pct']:.1f}%",
-                 delta=f"{summary['neutral_count']} berita", delta_color="off")
+    render_metrics(summary)
     
     # Visualization
     st.markdown("---")
     st.markdown("### 📊 Visualisasi Sentimen")
+    render_sentiment_chart(summary)
     
-    chart_data = pd.DataFrame({
-        'Sentimen': ['Positif', 'Negatif', 'Netral'],
-        'Jumlah': [summary['positive_count'], summary['negative_count'], summary['neutral_count']]
-    })
-    
-    st.bar_chart(chart_data.set_index('Sentimen')['Jumlah'])
+    # Trend per waktu
+    st.markdown("---")
+    st.markdown("### 📈 Momentum Sentimen")
+    render_trend(get_trend(analyzed_articles, topic))
     
     # News List
     st.markdown("---")
@@ -548,19 +673,24 @@ if st.session_state.summary and st.session_state.analyzed_articles:
         )
     
     with col2:
-        all_sources = sorted(list(set([a['source'] for a in analyzed_articles])))
+        groups = get_article_groups(analyzed_articles)
+        all_sources = groups['sources']
         source_filter = st.multiselect(
             "Filter Sumber",
             all_sources,
             default=all_sources[:10] if len(all_sources) > 10 else all_sources
         )
     
-    filtered_articles = [
-        a for a in analyzed_articles
-        if a['sentiment'] in sentiment_filter and a['source'] in source_filter
-    ]
+    # Indeks per (sentimen, sumber) dihitung sekali per analisis; filter hanya
+    # menggabungkan grup yang dipilih, tanpa memindai ulang seluruh artikel
+    tab_indices = {
+        sentiment: list(heapq.merge(*(groups['by_sentiment'][sentiment].get(source, [])
+                                      for source in source_filter)))
+        if sentiment in sentiment_filter else []
+        for sentiment in ['positive', 'negative', 'neutral']
+    }
     
-    st.markdown(f"**Menampilkan {len(filtered_articles)} dari {summary['total']} berita**")
+    st.markdown(f"**Menampilkan {sum(map(len, tab_indices.values()))} dari {summary['total']} berita**")
     
     # Tabs
     tab1, tab2, tab3 = st.tabs([
@@ -569,12 +699,26 @@ if st.session_state.summary and st.session_state.analyzed_articles:
         f"😐 Netral ({summary['neutral_count']})"
     ])
     
-    def display_articles(articles, max_display=30):
-        if not articles:
+    def display_articles(sentiment, page_size=ARTICLES_PER_PAGE):
+        indices = tab_indices[sentiment]
+        if not indices:
             st.info("Tidak ada berita")
             return
         
-        for idx, article in enumerate(articles[:max_display], 1):
+        # Hanya halaman yang terlihat yang dibangun widget-nya
+        pages = (len(indices) + page_size - 1) // page_size
+        page = 1
+        if pages > 1:
+            # Nilai halaman hanya diatur lewat session state (tanpa value=) agar
+            # filter bisa memperkecil jumlah halaman di bawah halaman yang dibuka
+            page_key = f"page_{sentiment}"
+            st.session_state[page_key] = min(st.session_state.get(page_key, 1), pages)
+            page = st.number_input(f"Halaman (dari {pages})", min_value=1, max_value=pages,
+                                   step=1, key=page_key)
+        offset = (page - 1) * page_size
+        
+        for idx, article_idx in enumerate(indices[offset:offset + page_size], offset + 1):
+            article = analyzed_articles[article_idx]
             emoji = {'positive': '😊', 'negative': '😟', 'neutral': '😐'}[article['sentiment']]
             color = {'positive': '#28a745', 'negative': '#dc3545', 'neutral': '#ffc107'}[article['sentiment']]
             
@@ -601,13 +745,13 @@ if st.session_state.summary and st.session_state.analyzed_articles:
                         st.metric("Confidence", f"{article.get('confidence', 0):.1f}%")
     
     with tab1:
-        display_articles([a for a in filtered_articles if a['sentiment'] == 'positive'])
+        display_articles('positive')
     
     with tab2:
-        display_articles([a for a in filtered_articles if a['sentiment'] == 'negative'])
+        display_articles('negative')
     
     with tab3:
-        display_articles([a for a in filtered_articles if a['sentiment'] == 'neutral'])
+        display_articles('neutral')
     
     # Export
     st.markdown("---")
@@ -615,49 +759,39 @@ if st.session_state.summary and st.session_state.analyzed_articles:
     
     col1, col2 = st.columns(2)
     
+    # File export baru dibuat saat tombol download diklik, lalu disimpan per hasil analisis
+    exports = get_export_memo(analyzed_articles, topic)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    
     with col1:
-        df_export = pd.DataFrame([{
-            'Title': a['title'],
-            'Description': a.get('description', ''),
-            'Source': a['source'],
-            'Sentiment': a['sentiment'],
-            'Confidence': a.get('confidence', 0),
-            'URL': a.get('url', '')
-        } for a in analyzed_articles])
-        
-        csv = df_export.to_csv(index=False)
+        export_format = st.selectbox(
+            "Format Export",
+            available_formats(),
+            format_func=str.upper
+        )
+        mime, extension = EXPORT_FORMATS[export_format]
         
         st.download_button(
-            "📥 Download CSV",
-            csv,
-            f"sentiment_{topic.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-            "text/csv",
+            f"📥 Download {export_format.upper()}",
+            lambda: memoized_export(exports, export_format,
+                                    lambda: export_articles(topic, analyzed_articles, export_format)),
+            f"sentiment_{topic.replace(' ', '_')}_{timestamp}.{extension}",
+            mime,
+            on_click="ignore",
             use_container_width=True
         )
     
     with col2:
-        report = f"""SENTIMENT ANALYSIS REPORT
-========================
-Topik: {topic.upper()}
-Tanggal: {datetime.now().strftime('%d %B %Y %H:%M')}
-
-RINGKASAN:
-- Total: {summary['total']}
-- Trend: {summary['overall_trend']}
-
-DISTRIBUSI:
-- Positif: {summary['positive_count']} ({summary['positive_pct']:.1f}%)
-- Negatif: {summary['negative_count']} ({summary['negative_pct']:.1f}%)
-- Netral: {summary['neutral_count']} ({summary['neutral_pct']:.1f}%)
-"""
-        
         st.download_button(
             "📄 Download Report",
-            report,
-            f"report_{topic.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+            lambda: memoized_export(exports, 'report', lambda: build_report(topic, summary)),
+            f"report_{topic.replace(' ', '_')}_{timestamp}.txt",
             "text/plain",
+            on_click="ignore",
             use_container_width=True
         )
+    
+    STAGE_SECONDS.observe(time.perf_counter() - render_start, stage='render')
 
 else:
     # Welcome Screen
@@ -681,7 +815,7 @@ else:
         - Analisis otomatis
         - Multi-source
         - Real-time
-        - Export CSV/TXT
+        - Export CSV/JSONL/Parquet
         """)
     
     with col2:
@@ -0,0 +1,72 @@
+"""Engine analisis sentimen berita sentiNews (tanpa Streamlit).
+
+Import bersifat lazy: ``from sentinews import SentimentAnalyzer`` hanya memuat
+modul analyzer, tanpa requests, numpy maupun pandas, sehingga worker/cron
+bisa start dalam hitungan milidetik.
+"""
+import importlib
+
+_EXPORTS = {
+    'TOKEN_PATTERN': 'analyzer',
+    'KeywordMatcher': 'analyzer',
+    'SentimentAnalyzer': 'analyzer',
+    'ResponseCache': 'cache',
+    'QuotaScheduler': 'quota',
+    'HTTPSessionPool': 'sessions',
+    'NewsAPIClient': 'client',
+    'ProviderError': 'client',
+    'ArticleRecord': 'records',
+    'NearDuplicateDetector': 'dedup',
+    'normalize_title': 'dedup',
+    'normalize_url': 'dedup',
+    'strip_source_suffix': 'dedup',
+    'ProviderRecorder': 'replay',
+    'ProviderReplay': 'replay',
+    'REGISTRY': 'metrics',
+    'stage': 'metrics',
+    'start_metrics_server': 'metrics',
+    'EXPORT_FORMATS': 'export',
+    'available_formats': 'export',
+    'export_articles': 'export',
+    'open_writer': 'export',
+    'write_articles': 'export',
+    'DEEP_FETCH_MAX_PAGES': 'pipeline',
+    'plan_provider_calls': 'pipeline',
+    'aggregate_news': 'pipeline',
+    'stream_provider_batches': 'pipeline',
+    'stream_news': 'pipeline',
+    'stream_scored_batches': 'pipeline',
+    'create_sentiment_summary': 'pipeline',
+    'build_summary': 'pipeline',
+    'SentimentAggregator': 'pipeline',
+    'analyze_topic': 'pipeline',
+    'ArticleStore': 'store',
+    'TrendAggregator': 'trends',
+    'published_epochs': 'trends',
+    'ProviderPlanner': 'planner',
+    'PrewarmScheduler': 'prewarm',
+    'ResultCache': 'results',
+    'PRESET_TOPICS': 'topics',
+    'PRESET_TICKERS': 'topics',
+    'TICKER_ALIASES': 'topics',
+    'TickerRouter': 'watchlist',
+    'analyze_watchlist': 'watchlist',
+    'build_or_queries': 'watchlist',
+    'watchlist_table': 'watchlist',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,330 @@
+"""Analisis sentimen berbasis keyword (tanpa dependensi Streamlit)"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+import re
+
+from .metrics import stage
+from .records import ArticleRecord
+
+# ============================================================================
+# KEYWORD MATCHER CLASS
+# ============================================================================
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Imbuhan untuk mencocokkan bentuk turunan keyword satu kata (affixes=True),
+# mis. 'surges' -> 'surge', 'kenaikan' -> 'naik', 'penurunan' -> 'turun'
+AFFIX_SUFFIXES = (
+    'nya', 'lah', 'kah', 'kan', 'an', 'i',                 # Indonesia
+    'ments', 'ment', 'ness', 'ful', 'ing', 'ers', 'est', 'ies', 'ied', 'ier', 'ily',
+    'ed', 'er', 'es', 'en', 'ly', 'd', 's', 'y'            # Inggris
+)
+# Prefix Indonesia -> huruf awal kata dasar yang luluh (meN-/peN-)
+AFFIX_PREFIXES = {
+    'meng': 'k', 'meny': 's', 'men': 't', 'mem': 'p', 'me': '',
+    'peng': 'k', 'peny': 's', 'pen': 't', 'pem': 'p', 'pe': '',
+    'per': '', 'ber': '', 'ter': '', 'di': '', 'ke': ''
+}
+AFFIX_ROUNDS = 2          # maks. lapisan suffix & prefix yang dilepas
+AFFIX_MIN_STEM = 2
+
+
+class KeywordMatcher:
+    """Pencocokan banyak keyword sekaligus dalam satu kali scan teks.
+
+    Lexicon dikompilasi sekali menjadi hash index berbasis token, sehingga
+    biaya pencarian bergantung pada panjang teks, bukan jumlah keyword.
+    Pencocokan menghormati batas kata ('up' tidak cocok di dalam 'update').
+    Dengan affixes=True, keyword satu kata juga cocok dengan bentuk
+    berimbuhannya ('gains', 'kenaikan', 'menguatnya'); hit dilaporkan sebagai
+    keyword lexicon-nya. Hasil lookup per token disimpan di cache.
+    """
+
+    def __init__(self, lexicons, affixes=False):
+        # lexicons: {label: [keyword, ...]}, contoh {'positive': [...]}
+        self.labels = list(lexicons)
+        self.index = {}
+        self.phrase_starts = set()
+        self.max_tokens = 1
+        self.affixes = affixes
+        self._forms = {}
+
+        for label, words in lexicons.items():
+            for word in words:
+                tokens = TOKEN_PATTERN.findall(word.lower())
+                if not tokens:
+                    continue
+                self.index[' '.join(tokens)] = label
+                if len(tokens) > 1:
+                    self.phrase_starts.add(tokens[0])
+                self.max_tokens = max(self.max_tokens, len(tokens))
+
+    def lookup(self, word):
+        """(keyword, label) untuk satu token, atau None bila bukan keyword"""
+        form = self._forms.get(word, False)
+        if form is False:
+            label = self.index.get(word)
+            form = (word, label) if label else None
+            if form is None and self.affixes:
+                # Keyword terpanjang di antara kata dasar yang mungkin
+                stems = [stem for stem in _stem_candidates(word) if stem in self.index and ' ' not in stem]
+                if stems:
+                    keyword = max(stems, key=len)
+                    form = keyword, self.index[keyword]
+            self._forms[word] = form
+        return form
+
+    def _match_tokens(self, words):
+        """Yield (posisi_token, jumlah_token, keyword, label) untuk setiap hit"""
+        forms = self._forms
+        index = self.index
+        phrase_starts = self.phrase_starts
+
+        for i, word in enumerate(words):
+            hit = forms.get(word, False)
+            if hit is False:
+                hit = self.lookup(word)
+            if hit:
+                yield i, 1, hit[0], hit[1]
+
+            if word in phrase_starts:
+                for n in range(2, min(self.max_tokens, len(words) - i) + 1):
+                    phrase = ' '.join(words[i:i + n])
+                    label = index.get(phrase)
+                    if label:
+                        yield i, n, phrase, label
+
+    def find(self, text):
+        """Cari semua keyword dalam teks, urut berdasarkan posisi kemunculan.
+
+        Mengembalikan list tuple (keyword, label, start, end) dengan posisi
+        karakter pada teks (setelah lowercase).
+        """
+        if not text:
+            return []
+
+        matches = list(TOKEN_PATTERN.finditer(text.lower()))
+        words = [m.group() for m in matches]
+
+        return [
+            (keyword, label, matches[i].start(), matches[i + n - 1].end())
+            for i, n, keyword, label in self._match_tokens(words)
+        ]
+
+    def distinct(self, text):
+        """Keyword unik per label sesuai urutan kemunculan pertama (tanpa posisi)"""
+        result = {label: {} for label in self.labels}
+
+        if text:
+            for _, _, keyword, label in self._match_tokens(TOKEN_PATTERN.findall(text.lower())):
+                result[label][keyword] = True
+
+        return {label: list(keywords) for label, keywords in result.items()}
+
+    def scan(self, text):
+        """Ringkasan hasil pencocokan per label.
+
+        Mengembalikan {label: {keyword: {'count': n, 'positions': [(start, end), ...]}}}
+        dengan urutan keyword sesuai kemunculan pertama.
+        """
+        result = {label: {} for label in self.labels}
+
+        for keyword, label, start, end in self.find(text):
+            entry = result[label].setdefault(keyword, {'count': 0, 'positions': []})
+            entry['count'] += 1
+            entry['positions'].append((start, end))
+
+        return result
+
+
+def _stem_candidates(word):
+    """Kata dasar yang mungkin untuk token: lepas suffix lalu prefix (maks. AFFIX_ROUNDS lapis)"""
+    stems = {word}
+    current = {word}
+    for _ in range(AFFIX_ROUNDS):
+        found = set()
+        for form in current:
+            for suffix in AFFIX_SUFFIXES:
+                rest = form[:-len(suffix)]
+                if not form.endswith(suffix) or len(rest) < AFFIX_MIN_STEM:
+                    continue
+                found.update((rest, rest + 'e', rest + 'y'))
+                # dropped -> drop, rallies -> rally
+                if len(rest) > AFFIX_MIN_STEM and rest[-1] == rest[-2]:
+                    found.add(rest[:-1])
+                if rest.endswith('i'):
+                    found.add(rest[:-1] + 'y')
+        stems |= found
+        current = found
+
+    current = set(stems)
+    for _ in range(AFFIX_ROUNDS):
+        found = set()
+        for form in current:
+            for prefix, initial in AFFIX_PREFIXES.items():
+                rest = form[len(prefix):]
+                if not form.startswith(prefix) or len(rest) < AFFIX_MIN_STEM:
+                    continue
+                found.add(rest)
+                if initial and rest[0] in 'aeiou':
+                    found.add(initial + rest)
+        stems |= found
+        current = found
+    return stems
+
+
+# ============================================================================
+# SENTIMENT ANALYZER CLASS
+# ============================================================================
+PARALLEL_MIN_ARTICLES = 2000
+PARALLEL_CHUNK_SIZE = 1000
+
+
+class SentimentAnalyzer:
+    """Analisis sentimen menggunakan keyword-based approach"""
+    
+    def __init__(self):
+        # Kata-kata positif dalam bahasa Indonesia dan Inggris
+        self.positive_words_id = [
+            'naik', 'meningkat', 'positif', 'untung', 'profit', 'bagus', 'baik',
+            'optimis', 'bullish', 'rally', 'menguat', 'cemerlang', 'peluang',
+            'potensi', 'keuntungan', 'surplus', 'tumbuh', 'berkembang', 'maju',
+            'sukses', 'hebat', 'luar biasa', 'fantastis', 'menggembirakan',
+            'menjanjikan', 'kuat', 'solid', 'stabil', 'aman', 'percaya diri'
+        ]
+        
+        self.positive_words_en = [
+            'surge', 'gain', 'rise', 'up', 'higher', 'growth', 'increase',
+            'boost', 'strong', 'recover', 'soar', 'jump', 'rally', 'bullish',
+            'positive', 'profit', 'good', 'great', 'excellent', 'outstanding',
+            'impressive', 'promising', 'optimistic', 'confident', 'solid',
+            'stable', 'secure', 'success', 'win', 'breakthrough', 'advance'
+        ]
+        
+        # Kata-kata negatif dalam bahasa Indonesia dan Inggris
+        self.negative_words_id = [
+            'turun', 'menurun', 'negatif', 'rugi', 'loss', 'buruk', 'jelek',
+            'pesimis', 'bearish', 'crash', 'anjlok', 'melemah', 'risiko',
+            'bahaya', 'krisis', 'kerugian', 'defisit', 'gagal', 'mundur',
+            'jatuh', 'tertekan', 'lemah', 'khawatir', 'takut', 'panik',
+            'masalah', 'kesulitan', 'hambatan', 'kendala', 'ancaman'
+        ]
+        
+        self.negative_words_en = [
+            'drop', 'fall', 'down', 'lower', 'decline', 'decrease', 'plunge',
+            'weak', 'slump', 'tumble', 'bearish', 'negative', 'loss', 'bad',
+            'poor', 'terrible', 'awful', 'disappointing', 'concerning',
+            'worrying', 'risk', 'danger', 'crisis', 'fail', 'problem',
+            'difficulty', 'obstacle', 'threat', 'fear', 'panic', 'crash'
+        ]
+        
+        self.all_positive = self.positive_words_id + self.positive_words_en
+        self.all_negative = self.negative_words_id + self.negative_words_en
+        
+        # Kompilasi lexicon sekali, dipakai ulang untuk setiap artikel
+        self.matcher = KeywordMatcher({
+            'positive': self.all_positive,
+            'negative': self.all_negative
+        }, affixes=True)
+    
+    def analyze(self, text):
+        """Analisis sentimen dari teks"""
+        if not text:
+            return 'neutral', 0, {'positive': [], 'negative': []}
+        
+        # Hitung kata-kata positif dan negatif yang ditemukan (satu kali scan)
+        hits = self.matcher.distinct(text)
+        positive_matches = hits['positive']
+        negative_matches = hits['negative']
+        
+        positive_count = len(positive_matches)
+        negative_count = len(negative_matches)
+        
+        total_sentiment_words = positive_count + negative_count
+        
+        # Tentukan sentimen
+        if total_sentiment_words == 0:
+            sentiment = 'neutral'
+            confidence = 0
+        elif positive_count > negative_count:
+            sentiment = 'positive'
+            confidence = (positive_count / total_sentiment_words) * 100
+        elif negative_count > positive_count:
+            sentiment = 'negative'
+            confidence = (negative_count / total_sentiment_words) * 100
+        else:
+            sentiment = 'neutral'
+            confidence = 50
+        
+        keyword_matches = {
+            'positive': positive_matches[:5],
+            'negative': negative_matches[:5]
+        }
+        
+        return sentiment, round(confidence, 1), keyword_matches
+    
+    def analyze_batch(self, articles, workers=1, chunk_size=PARALLEL_CHUNK_SIZE):
+        """Analisis sentimen untuk banyak artikel sekaligus
+        
+        workers > 1 (atau None = semua core) mengaktifkan mode paralel untuk
+        korpus besar. Batch kecil (< PARALLEL_MIN_ARTICLES) tetap serial agar
+        tidak menanggung biaya start process.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        # Iterable apa pun (termasuk generator) dipakai dua kali: skoring & zip
+        articles = list(articles)
+        
+        with stage('scoring'):
+            if workers > 1 and len(articles) >= PARALLEL_MIN_ARTICLES:
+                scores = self._score_parallel(articles, workers, chunk_size)
+            else:
+                scores = self.score_articles(articles)
+        
+        analyzed = []
+        
+        for article, (sentiment, confidence, keywords) in zip(articles, scores):
+            analyzed.append(ArticleRecord(article, sentiment=sentiment, confidence=confidence, keywords=keywords))
+        
+        return analyzed
+    
+    def score_articles(self, articles):
+        """Hasil analyze() untuk setiap artikel (judul + deskripsi + konten)"""
+        return [
+            self.analyze(f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}")
+            for article in articles
+        ]
+    
+    def analyze_stream(self, articles):
+        """Versi generator analyze_batch: skor setiap artikel begitu tersedia"""
+        for article in articles:
+            text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}"
+            sentiment, confidence, keywords = self.analyze(text)
+            
+            yield ArticleRecord(article, sentiment=sentiment, confidence=confidence, keywords=keywords)
+    
+    def _score_parallel(self, articles, workers, chunk_size):
+        """Bagi artikel per chunk ke process pool; urutan hasil = urutan input
+        
+        Analyzer (lexicon terkompilasi) dikirim sekali per worker lewat
+        initializer, bukan per chunk. Worker hanya mengembalikan skor.
+        """
+        chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                 initializer=_init_analyzer_worker,
+                                 initargs=(self,)) as executor:
+            return [score for chunk in executor.map(_score_chunk, chunks) for score in chunk]
+
+
+# Analyzer milik proses worker (diisi sekali oleh initializer process pool)
+_worker_analyzer = None
+
+
+def _init_analyzer_worker(analyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _score_chunk(articles):
+    return _worker_analyzer.score_articles(articles)
@@ -0,0 +1,124 @@
+"""Cache respons provider yang persisten di disk"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .metrics import CACHE_LOOKUPS
+
+# ============================================================================
+# RESPONSE CACHE CLASS
+# ============================================================================
+CACHE_DIR = os.environ.get(
+    'SENTINEWS_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+)
+CACHE_TTL_SECONDS = 30 * 60
+CACHE_MAX_ENTRIES = 500
+
+
+class ResponseCache:
+    """Cache respons provider yang persisten di disk (SQLite) dengan TTL.
+    
+    Key: provider, query, bahasa, negara (dan ukuran halaman). Entri yang
+    jarang dipakai dibuang (LRU) saat jumlahnya melebihi max_entries.
+    Aman dipakai bersamaan dari beberapa thread fetch.
+    """
+    
+    def __init__(self, path=None, ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES):
+        self.path = path or os.path.join(CACHE_DIR, 'responses.sqlite')
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+    
+    @staticmethod
+    def make_key(provider, query, language=None, country=None, size=None, page=None):
+        """Key cache yang stabil untuk satu permintaan provider (halaman pertama tanpa page)"""
+        parts = [provider, query.strip().lower(), language, country, size]
+        if page is not None:
+            parts.append(page)
+        return json.dumps(parts)
+    
+    def get(self, key):
+        """Ambil (articles, umur_detik) bila masih segar, selain itu None"""
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                CACHE_LOOKUPS.inc(cache='response', result='miss')
+                return None
+            
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            self.hits += 1
+            CACHE_LOOKUPS.inc(cache='response', result='hit')
+        
+        return json.loads(row[0]), now - row[1]
+    
+    def put(self, key, provider, articles):
+        """Simpan hasil fetch lalu buang entri LRU bila melebihi batas"""
+        now = time.time()
+        payload = json.dumps(articles, ensure_ascii=False)
+        
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, payload, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, provider, payload, now, now)
+            )
+            self._conn.execute("""
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+    
+    def peek(self, key):
+        """Ambil (articles, umur_detik) walau sudah kedaluwarsa, tanpa statistik"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+    
+    def clear(self):
+        """Hapus semua entri cache"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+    
+    def stats(self):
+        """Statistik hit/miss sejak proses berjalan dan jumlah entri di disk"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': entries,
+                'hit_rate': (self.hits / lookups * 100) if lookups else 0
+            }
@@ -0,0 +1,171 @@
+"""CLI batch: analisis banyak topik/ticker lalu tulis hasil ke JSONL/CSV
+
+Contoh:
+    python -m sentinews "BTC Bitcoin" "TLKM Telkom Indonesia" -o hasil.jsonl
+    python -m sentinews --presets --format csv -o hasil.csv
+    python -m sentinews --presets -o hasil.parquet
+    python -m sentinews "BTC Bitcoin" --record rekaman.jsonl.gz
+    python -m sentinews "BTC Bitcoin" --replay rekaman.jsonl.gz --replay-latency recorded
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+
+from .analyzer import SentimentAnalyzer
+from .cache import ResponseCache
+from .client import NewsAPIClient
+from .export import open_writer, write_articles
+from .metrics import REGISTRY
+from .pipeline import aggregate_news, create_sentiment_summary, stream_scored_batches
+from .planner import ProviderPlanner
+from .quota import QuotaScheduler
+from .replay import ProviderRecorder, ProviderReplay
+from .sessions import HTTPSessionPool
+from .store import LOCAL_MAX_AGE_SECONDS, ArticleStore
+from .topics import PRESET_TOPICS
+from .trends import TREND_WINDOWS, TrendAggregator
+from .watchlist import analyze_watchlist
+
+logger = logging.getLogger(__name__)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m sentinews',
+        description='Analisis sentimen berita untuk banyak topik/ticker tanpa UI Streamlit.'
+    )
+    parser.add_argument('topics', nargs='*', help='Topik/ticker, contoh: "BTC Bitcoin"')
+    parser.add_argument('--presets', action='store_true', help='Analisis semua topik preset')
+    parser.add_argument('--watchlist', nargs='*', metavar='TICKER',
+                        help='Mode watchlist: semua ticker (atau yang disebut) dalam satu fetch bersama')
+    parser.add_argument('--news-type', choices=['both', 'international', 'local'], default='both')
+    parser.add_argument('--max-articles', type=int, default=100)
+    parser.add_argument('--max-pages', type=int, default=1,
+                        help='Deep fetch: ikuti hingga N halaman per panggilan provider')
+    parser.add_argument('--plan', action='store_true',
+                        help='Urutkan panggilan provider menurut riwayat & lewati yang tidak diperlukan')
+    parser.add_argument('--format', choices=['jsonl', 'csv', 'parquet'],
+                        help='Format output (default: dari ekstensi file, selain itu jsonl)')
+    parser.add_argument('-o', '--output', default='-', help='File output artikel (default: stdout)')
+    parser.add_argument('--summary-output', help='File JSONL ringkasan per topik')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Jumlah proses untuk skoring dengan --no-store (0 = semua core)')
+    parser.add_argument('--metrics-output', help='Tulis metrik (format teks Prometheus) ke file ini di akhir run')
+    parser.add_argument('--record', metavar='FILE', help='Rekam respons mentah provider ke file gzip JSONL')
+    parser.add_argument('--replay', metavar='FILE',
+                        help='Putar ulang respons dari file rekaman (tanpa jaringan, cache & kuota)')
+    parser.add_argument('--replay-latency', default=None,
+                        help="Latensi simulasi saat replay: detik tetap atau 'recorded'")
+    parser.add_argument('--no-cache', action='store_true', help='Jangan pakai cache respons')
+    parser.add_argument('--no-store', action='store_true',
+                        help='Jangan pakai arsip artikel lokal (fetch & skor ulang semua berita)')
+    parser.add_argument('--local-max-age', type=float, default=LOCAL_MAX_AGE_SECONDS,
+                        help='Jawab dari arsip lokal tanpa fetch bila topik diperbarui dalam N detik '
+                             'terakhir dan arsipnya cukup (0 = selalu fetch)')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+    )
+
+    topics = list(args.topics)
+    if args.presets:
+        topics.extend(query for query in PRESET_TOPICS.values() if query not in topics)
+    if not topics and args.watchlist is None:
+        build_parser().error('masukkan minimal satu topik, --presets atau --watchlist')
+
+    output_format = args.format or next(
+        (fmt for fmt in ('csv', 'parquet') if args.output.endswith('.' + fmt)), 'jsonl'
+    )
+    if output_format == 'parquet' and args.output == '-':
+        build_parser().error('format parquet membutuhkan -o FILE')
+
+    replay = None
+    if args.replay:
+        latency = args.replay_latency
+        replay = ProviderReplay(args.replay, latency=latency if latency in (None, 'recorded') else float(latency))
+
+    client = NewsAPIClient(
+        cache=None if args.no_cache or replay else ResponseCache(),
+        sessions=HTTPSessionPool(),
+        quota=None if replay else QuotaScheduler(),
+        recorder=ProviderRecorder(args.record) if args.record else None,
+        replay=replay
+    )
+    analyzer = SentimentAnalyzer()
+    planner = ProviderPlanner() if args.plan else None
+    # Replay butuh request yang sama persis dengan rekaman, jadi tanpa fetch inkremental
+    store = None if args.no_store or replay else ArticleStore(max_age=args.local_max_age)
+
+    if args.output == '-':
+        output = sys.stdout
+    elif output_format == 'parquet':
+        output = open(args.output, 'wb')
+    else:
+        output = open(args.output, 'w', encoding='utf-8', newline='')
+    summary_output = open(args.summary_output, 'w', encoding='utf-8') if args.summary_output else None
+
+    writer = None
+    try:
+        writer = open_writer(output_format, output)
+
+        if args.watchlist is not None:
+            start_time = time.time()
+            result = analyze_watchlist(args.watchlist or None, args.news_type, args.max_articles,
+                                       client=client, analyzer=analyzer)
+
+            for ticker, articles in result['articles'].items():
+                write_articles(writer, ticker, articles)
+                if summary_output is not None:
+                    summary = result['summaries'][ticker]
+                    summary_output.write(json.dumps({'topic': ticker, **(summary or {'total': 0})},
+                                                    ensure_ascii=False) + '\n')
+
+            logger.info("watchlist: %d ticker, %d panggilan provider (%.1f detik)",
+                        len(result['articles']), result['calls'], time.time() - start_time)
+
+        for topic in topics:
+            start_time = time.time()
+            if store is not None:
+                # Fetch inkremental per batch: semua artikel unik disimpan ke arsip
+                batches = list(stream_scored_batches(topic, args.news_type, args.max_articles, client=client,
+                                                     analyzer=analyzer, max_pages=args.max_pages,
+                                                     planner=planner, store=store))
+                if [label for label, _ in batches] == ['Arsip lokal']:
+                    logger.info("%s: dijawab dari arsip lokal", topic)
+                analyzed = [article for _, batch in batches for article in batch]
+            else:
+                articles = aggregate_news(topic, args.news_type, args.max_articles, client=client,
+                                          max_pages=args.max_pages, planner=planner)
+                analyzed = analyzer.analyze_batch(articles, workers=args.workers or None)
+            summary = create_sentiment_summary(analyzed)
+
+            write_articles(writer, topic, analyzed)
+
+            logger.info("%s: %d berita, trend %s (%.1f detik)", topic, len(analyzed),
+                        summary['overall_trend'] if summary else '-', time.time() - start_time)
+
+            if summary_output is not None:
+                trend = TrendAggregator.from_articles(analyzed)
+                windows = {f'last_{label}': trend.window(label) for label in TREND_WINDOWS}
+                summary_output.write(json.dumps({'topic': topic, **(summary or {'total': 0}), **windows},
+                                                ensure_ascii=False) + '\n')
+    finally:
+        if writer is not None:
+            writer.close()
+        if output is not sys.stdout:
+            output.close()
+        if summary_output is not None:
+            summary_output.close()
+        client.sessions.close()
+        if args.metrics_output:
+            with open(args.metrics_output, 'w', encoding='utf-8') as f:
+                f.write(REGISTRY.render())
+
+    return 0
@@ -0,0 +1,319 @@
+"""Client NewsData.io & GNews"""
+from datetime import datetime, timezone
+import logging
+import threading
+import time
+
+from .cache import ResponseCache
+from .metrics import REGISTRY
+from .quota import QuotaScheduler
+from .sessions import HTTP_TIMEOUT, HTTPSessionPool
+
+logger = logging.getLogger(__name__)
+
+# Endpoint default; bisa diganti per client (mis. mock server untuk benchmark)
+PROVIDER_BASE_URLS = {
+    'newsdata': "https://newsdata.io/api/1/news",
+    'gnews': "https://gnews.io/api/v4/search"
+}
+
+PROVIDER_REQUESTS = REGISTRY.counter(
+    'sentinews_provider_requests_total', 'Fetch provider menurut hasil (hit/stale/miss/denied/error)',
+    ['provider', 'language', 'status']
+)
+PROVIDER_SECONDS = REGISTRY.histogram(
+    'sentinews_provider_request_seconds', 'Durasi request HTTP ke provider', ['provider', 'language', 'status']
+)
+PROVIDER_BYTES = REGISTRY.counter(
+    'sentinews_provider_response_bytes_total', 'Byte respons yang diterima dari provider', ['provider']
+)
+PROVIDER_ARTICLES = REGISTRY.counter(
+    'sentinews_provider_articles_total', 'Artikel yang dikembalikan provider', ['provider', 'status']
+)
+PROVIDER_ERRORS = REGISTRY.counter(
+    'sentinews_provider_errors_total', 'Request provider yang gagal', ['provider', 'error']
+)
+
+
+def parse_published(value):
+    """publishedAt kedua provider -> datetime UTC; None bila tak terbaca
+    
+    NewsData.io memberi 'YYYY-MM-DD HH:MM:SS' (UTC), GNews ISO 8601 dengan 'Z'.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def normalize_published(value):
+    """publishedAt -> 'YYYY-MM-DDTHH:MM:SSZ' (UTC) yang bisa dibandingkan sebagai string; '' bila tak terbaca"""
+    parsed = parse_published(value)
+    return parsed.strftime('%Y-%m-%dT%H:%M:%SZ') if parsed is not None else ''
+
+
+def published_since(articles, since):
+    """Artikel yang terbit pada/sesudah since (tanggal tak terbaca tetap disertakan)"""
+    if not since:
+        return articles
+    return [
+        article for article in articles
+        if (normalize_published(article.get('publishedAt')) or since) >= since
+    ]
+
+
+# ============================================================================
+# NEWS API CLIENT CLASS
+# ============================================================================
+class ProviderError(Exception):
+    """Provider merespons dengan status selain 200"""
+
+
+class NewsAPIClient:
+    """Client untuk berbagai News API gratis"""
+    
+    def __init__(self, cache=None, sessions=None, timeout=HTTP_TIMEOUT, quota=None, base_urls=None,
+                 recorder=None, replay=None):
+        # ========================================================================
+        # API KEYS - SUDAH DIISI
+        # ========================================================================
+        
+        self.newsdata_key = "pub_cde750ce48074b45a714654be4063bf4"
+        self.gnews_key = "20279dd1f36d7ad62d50144631657942"
+        
+        # Cache respons opsional (ResponseCache) & log tiap fetch untuk UI
+        self.cache = cache
+        self.fetch_log = []
+        self._last = threading.local()
+        
+        # Pool koneksi keep-alive per provider, sebaiknya dibagi antar client
+        self.sessions = sessions if sessions is not None else HTTPSessionPool()
+        self.timeout = timeout
+        
+        # Penjadwal kuota opsional (QuotaScheduler) sebelum request keluar
+        self.quota = quota
+        
+        self.base_urls = {**PROVIDER_BASE_URLS, **(base_urls or {})}
+        
+        # Rekam respons mentah (ProviderRecorder) atau putar ulang tanpa jaringan (ProviderReplay)
+        self.recorder = recorder
+        self.replay = replay
+    
+    def _cached_fetch(self, provider, language, key, request, count=len, empty=list):
+        """Layani dari cache bila ada, selain itu jalankan request lalu simpan
+        
+        Bila QuotaScheduler terpasang, request baru harus lolos pengecekan kuota
+        dulu: saat kuota menipis, key yang punya data lama (stale) dilayani dari
+        cache agar kuota tersisa dipakai untuk query yang belum pernah diambil.
+        
+        Payload default berupa daftar artikel; payload lain (mis. halaman dengan
+        cursor) memberi count (jumlah artikel) & empty (payload kosong) sendiri.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                payload, age = cached
+                self._log(provider, language, 'hit', age, count(payload))
+                return payload
+        
+        if self.quota is not None:
+            stale = self.cache.peek(key) if self.cache is not None else None
+            decision = self.quota.acquire(provider, has_stale=stale is not None)
+            
+            if decision == QuotaScheduler.DOWNGRADE:
+                payload, age = stale
+                self._log(provider, language, 'stale', age, count(payload))
+                return payload
+            if decision == QuotaScheduler.DENY:
+                logger.warning("%s (%s): kuota harian/burst habis, request dilewati", provider, language)
+                self._log(provider, language, 'denied', 0, 0, error='kuota habis')
+                return empty()
+        
+        start = time.perf_counter()
+        try:
+            payload, size = request()
+        except Exception as e:
+            # Hanya respons yang berhasil yang disimpan ke cache
+            seconds = time.perf_counter() - start
+            PROVIDER_SECONDS.observe(seconds, provider=provider, language=language, status='error')
+            PROVIDER_ERRORS.inc(provider=provider, error=type(e).__name__)
+            logger.warning("%s (%s): %s: %s", provider, language, type(e).__name__, e)
+            self._log(provider, language, 'error', 0, 0, error=f"{type(e).__name__}: {e}",
+                      seconds=seconds)
+            return empty()
+        
+        seconds = time.perf_counter() - start
+        PROVIDER_SECONDS.observe(seconds, provider=provider, language=language, status='miss')
+        PROVIDER_BYTES.inc(size, provider=provider)
+        
+        if self.cache is not None:
+            self.cache.put(key, provider, payload)
+        
+        self._log(provider, language, 'miss', 0, count(payload), seconds=seconds, size=size)
+        return payload
+    
+    def log_skipped(self, provider, language, reason):
+        """Catat panggilan yang sengaja tidak dijalankan (mis. target artikel sudah tercapai)"""
+        self._log(provider, language, 'skipped', 0, 0, error=reason)
+    
+    def _log(self, provider, language, status, age, count, error=None, seconds=0.0, size=0):
+        """Catat satu span fetch (untuk UI) sekaligus metrik per provider"""
+        PROVIDER_REQUESTS.inc(provider=provider, language=language, status=status)
+        PROVIDER_ARTICLES.inc(count, provider=provider, status=status)
+        logger.debug("span provider=%s language=%s status=%s count=%d bytes=%d seconds=%.3f",
+                     provider, language, status, count, size, seconds)
+        entry = {'provider': provider, 'language': language, 'status': status, 'age': age,
+                 'count': count, 'error': error, 'seconds': seconds, 'bytes': size}
+        self.fetch_log.append(entry)
+        self._last.entry = entry
+    
+    def last_fetch(self):
+        """Entri fetch_log terakhir yang dicatat thread ini (None bila belum ada)"""
+        return getattr(self._last, 'entry', None)
+    
+    def _get_json(self, provider, url, params):
+        """GET ke provider (atau rekaman); kembalikan (payload JSON, byte respons)"""
+        if self.replay is not None:
+            return self.replay.serve(provider, params)
+        
+        start = time.perf_counter()
+        response = self.sessions.get(provider).get(url, params=params, timeout=self.timeout)
+        if self.recorder is not None:
+            self.recorder.record(provider, params, response.status_code, response.text,
+                                 time.perf_counter() - start)
+        
+        if response.status_code != 200:
+            raise ProviderError(f"HTTP {response.status_code} {response.reason}")
+        
+        return response.json(), len(response.content)
+    
+    def fetch_newsdata_io(self, query, language='en', max_results=50, since=None):
+        """NewsData.io API - Free tier: 200 requests/day
+        
+        Endpoint /news free tier tidak punya filter tanggal, jadi since
+        ('YYYY-MM-DDTHH:MM:SSZ') diterapkan pada hasilnya.
+        """
+        size = min(max_results, 50)
+        key = ResponseCache.make_key('newsdata', query, language, None, size)
+        articles = self._cached_fetch(
+            'NewsData.io', language, key, lambda: self._request_newsdata_io(query, language, size)
+        )
+        return published_since(articles, since)
+    
+    def fetch_newsdata_page(self, query, language='en', max_results=50, page=None, since=None):
+        """Satu halaman NewsData.io; kembalikan (artikel, cursor nextPage atau None)
+        
+        Hasil urut terbaru dulu: begitu halaman memuat artikel yang lebih lama
+        dari since, halaman berikutnya tidak perlu diminta.
+        """
+        size = min(max_results, 50)
+        key = ResponseCache.make_key('newsdata', query, language, None, size, page=page or 1)
+        result = self._cached_fetch(
+            'NewsData.io', language, key, lambda: self._request_newsdata_page(query, language, size, page),
+            count=lambda result: len(result['articles']),
+            empty=lambda: {'articles': [], 'next_page': None}
+        )
+        articles = published_since(result['articles'], since)
+        return articles, result['next_page'] if len(articles) == len(result['articles']) else None
+    
+    def _request_newsdata_io(self, query, language, size):
+        """Request ke NewsData.io; kembalikan (artikel, byte respons)"""
+        result, nbytes = self._request_newsdata_page(query, language, size)
+        return result['articles'], nbytes
+    
+    def _request_newsdata_page(self, query, language, size, page=None):
+        """Request satu halaman NewsData.io; kembalikan ({articles, next_page}, byte respons)"""
+        url = self.base_urls['newsdata']
+        
+        params = {
+            'apikey': self.newsdata_key,
+            'q': query,
+            'language': language,
+            'size': size
+        }
+        
+        if page:
+            params['page'] = page
+        
+        data, nbytes = self._get_json('newsdata', url, params)
+        articles = []
+        
+        if data.get('status') == 'success' and 'results' in data:
+            for item in data['results']:
+                articles.append({
+                    'title': item.get('title', ''),
+                    'description': item.get('description', ''),
+                    'content': item.get('content', ''),
+                    'source': item.get('source_id', 'Unknown'),
+                    'url': item.get('link', ''),
+                    'publishedAt': item.get('pubDate', ''),
+                    'image': item.get('image_url', ''),
+                    'language': language
+                })
+        
+        return {'articles': articles, 'next_page': data.get('nextPage')}, nbytes
+    
+    def fetch_gnews(self, query, language='en', country=None, max_results=50, since=None):
+        """GNews API - Free tier: 100 requests/day
+        
+        since ('YYYY-MM-DDTHH:MM:SSZ') diterapkan pada hasilnya, seperti
+        NewsData.io: respons tanpa filter tanggal tetap berbagi satu entri
+        cache (dan salinan stale) untuk semua fetch inkremental.
+        """
+        size = min(max_results, 100)
+        key = ResponseCache.make_key('gnews', query, language, country, size)
+        articles = self._cached_fetch(
+            'GNews', language, key, lambda: self._request_gnews(query, language, country, size)
+        )
+        return published_since(articles, since)
+    
+    def fetch_gnews_page(self, query, language='en', country=None, max_results=50, page=1, since=None):
+        """Satu halaman GNews; kembalikan (artikel, nomor halaman berikutnya atau None)"""
+        size = min(max_results, 100)
+        # Halaman pertama berbagi cache dengan fetch_gnews
+        key = ResponseCache.make_key('gnews', query, language, country, size, page=page if page > 1 else None)
+        result = self._cached_fetch(
+            'GNews', language, key, lambda: self._request_gnews(query, language, country, size, page)
+        )
+        articles = published_since(result, since)
+        has_next = len(result) >= size and len(articles) == len(result)
+        return articles, page + 1 if has_next else None
+    
+    def _request_gnews(self, query, language, country, size, page=1):
+        """Request ke GNews; kembalikan (artikel, byte respons)"""
+        url = self.base_urls['gnews']
+        
+        params = {
+            'q': query,
+            'lang': language,
+            'max': size,
+            'apikey': self.gnews_key
+        }
+        
+        if country:
+            params['country'] = country
+        if page > 1:
+            params['page'] = page
+        
+        data, nbytes = self._get_json('gnews', url, params)
+        articles = []
+        
+        if 'articles' in data:
+            for item in data['articles']:
+                articles.append({
+                    'title': item.get('title', ''),
+                    'description': item.get('description', ''),
+                    'content': item.get('content', ''),
+                    'source': item.get('source', {}).get('name', 'Unknown'),
+                    'url': item.get('url', ''),
+                    'publishedAt': item.get('publishedAt', ''),
+                    'image': item.get('image', ''),
+                    'language': language
+                })
+        
+        return articles, nbytes
@@ -0,0 +1,190 @@
+"""Deteksi berita duplikat / hampir sama"""
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import zlib
+
+import numpy as np
+
+from .analyzer import TOKEN_PATTERN
+
+# ============================================================================
+# NEAR-DUPLICATE DETECTOR CLASS
+# ============================================================================
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MINHASH_PERMUTATIONS = 64
+MINHASH_PRIME = (1 << 31) - 1
+SHINGLE_SIZE = 5
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'cmpid', 'ocid')
+SOURCE_SUFFIX_PATTERN = re.compile(r"\s+[-|–—]\s+([^-|–—]{1,40})$")
+SOURCE_MIN_LENGTH = 3
+NUMBER_PATTERN = re.compile(r"\d+")
+
+
+def normalize_url(url):
+    """URL kanonik: tanpa skema, www, fragment, trailing slash & parameter tracking"""
+    if not url:
+        return ''
+    
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip('/')
+    
+    return f"{host}{path}" + (f"?{urlencode(query)}" if query else '')
+
+
+def normalize_title(title, strip_source=True):
+    """Judul tanpa sufiks sumber (' - Reuters'), huruf kecil & tanpa tanda baca"""
+    title = (title or '').strip()
+    if strip_source:
+        title = SOURCE_SUFFIX_PATTERN.sub('', title)
+    return ' '.join(TOKEN_PATTERN.findall(title.lower()))
+
+
+def _compact(text):
+    # 'CNBC Indonesia', 'cnbcindonesia' & 'cnbcindonesia.com' -> 'cnbcindonesia'
+    text = re.sub(r"\.(com|co\.id|co|id|net|org)$", '', (text or '').strip().lower())
+    return ''.join(TOKEN_PATTERN.findall(text))
+
+
+def strip_source_suffix(title, source):
+    """Judul tanpa sufiks ' - Reuters' / ' | CNBC', hanya bila sufiks itu sumber artikel sendiri
+
+    Sufiks lain (' - October 16', ' - stocks rally') dianggap bagian judul.
+    """
+    title = (title or '').strip()
+    match = SOURCE_SUFFIX_PATTERN.search(title)
+    if not match:
+        return title
+    suffix, source = _compact(match.group(1)), _compact(source)
+    if min(len(suffix), len(source)) >= SOURCE_MIN_LENGTH and (suffix.startswith(source) or
+                                                                source.startswith(suffix)):
+        return title[:match.start()]
+    return title
+
+
+class NearDuplicateDetector:
+    """Deteksi berita hampir sama (syndicated) dengan URL kanonik + MinHash/LSH.
+    
+    Setiap artikel dibandingkan hanya dengan kandidat yang berbagi bucket LSH,
+    jadi biayanya mendekati linear. Artikel pertama dalam klaster dipertahankan
+    dan field 'duplicate_count' mencatat berapa salinan yang digabungkan.
+    Kemiripan = maksimum dari kemiripan judul saja dan judul + deskripsi,
+    sehingga salinan syndicated dengan deskripsi berbeda/kosong tetap tergabung;
+    judul saja hanya dihitung bila angka di judul sama ('... - October 16' dan
+    '... - October 17' tetap berita berbeda).
+    """
+    
+    def __init__(self, threshold=NEAR_DUPLICATE_THRESHOLD, num_perm=MINHASH_PERMUTATIONS):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        
+        rng = np.random.default_rng(42)
+        self._a = rng.integers(1, MINHASH_PRIME, size=num_perm, dtype=np.int64)
+        self._b = rng.integers(0, MINHASH_PRIME, size=num_perm, dtype=np.int64)
+        
+        # Banding LSH: rows per band terbesar yang ambang estimasinya <= threshold
+        self.rows = 1
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows == 0 and (rows / num_perm) ** (1 / rows) <= threshold:
+                self.rows = rows
+        self.bands = num_perm // self.rows
+        
+        self._by_url = {}
+        self._by_title = {}
+        self._buckets = {}
+        self._kept = []
+        self._signatures = []       # (judul, judul + deskripsi) per artikel
+        self._numbers = []
+        self.clusters = 0
+        self.duplicates = 0
+    
+    @staticmethod
+    def _shingles(text):
+        """Shingle karakter dari teks yang sudah dinormalisasi"""
+        if len(text) <= SHINGLE_SIZE:
+            return {text}
+        return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    
+    def _signature(self, shingles):
+        """MinHash signature dari himpunan shingle"""
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) & MINHASH_PRIME for shingle in shingles),
+            dtype=np.int64, count=len(shingles)
+        )
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % MINHASH_PRIME).min(axis=1)
+    
+    def _mark_duplicate(self, index):
+        canonical = self._kept[index]
+        if not canonical.get('duplicate_count'):
+            self.clusters += 1
+        canonical['duplicate_count'] = canonical.get('duplicate_count', 0) + 1
+        self.duplicates += 1
+        return False
+    
+    def add(self, article):
+        """True bila artikel baru (disimpan), False bila duplikat dari yang sudah ada"""
+        url = normalize_url(article.get('url', ''))
+        # Key judul persis: sufiks dilepas hanya bila itu nama sumber artikel
+        # ('Judul - Reuters' == 'Judul'), sufiks lain tetap bagian judul
+        title = normalize_title(strip_source_suffix(article.get('title', ''), article.get('source')),
+                                strip_source=False)
+        
+        if url and url in self._by_url:
+            return self._mark_duplicate(self._by_url[url])
+        if title and title in self._by_title:
+            return self._mark_duplicate(self._by_title[title])
+        
+        description = normalize_title(article.get('description', ''), strip_source=False)
+        # Shingle judul + deskripsi = shingle judul + sisanya, jadi signature
+        # judul cukup dihitung sekali
+        title_shingles = self._shingles(title)
+        title_signature = self._signature(title_shingles)
+        rest = self._shingles(f"{title} {description}") - title_shingles if description else None
+        signatures = (title_signature,
+                      np.minimum(title_signature, self._signature(rest)) if rest else title_signature)
+        band_keys = [
+            (kind, band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for kind, signature in enumerate(signatures[:1] if rest is None else signatures)
+            for band in range(self.bands)
+        ]
+        
+        candidates = set()
+        for key in band_keys:
+            candidates.update(self._buckets.get(key, ()))
+        
+        numbers = NUMBER_PATTERN.findall(title)
+        for index in sorted(candidates):
+            kept_title, kept_text = self._signatures[index]
+            similarity = np.mean(kept_text == signatures[1])
+            if self._numbers[index] == numbers:
+                similarity = max(similarity, np.mean(kept_title == title_signature))
+            if similarity >= self.threshold:
+                return self._mark_duplicate(index)
+        
+        index = len(self._kept)
+        article.setdefault('duplicate_count', 0)
+        self._kept.append(article)
+        self._signatures.append(signatures)
+        self._numbers.append(numbers)
+        if url:
+            self._by_url[url] = index
+        if title:
+            self._by_title[title] = index
+        for key in band_keys:
+            self._buckets.setdefault(key, []).append(index)
+        
+        return True
+    
+    def collapse(self, articles):
+        """Versi batch add(): daftar artikel unik dengan urutan tetap"""
+        return [article for article in articles if self.add(article)]
+    
+    def stats(self):
+        return {'duplicate_clusters': self.clusters, 'duplicates_removed': self.duplicates}
@@ -0,0 +1,176 @@
+"""Export hasil analisis ke CSV / JSONL / Parquet
+
+Writer menulis baris demi baris (Parquet per row group), sehingga export besar
+tidak perlu menampung seluruh file di memori. pyarrow opsional: hanya
+dibutuhkan untuk Parquet.
+"""
+import csv
+import importlib.util
+import io
+import json
+from datetime import datetime
+
+ARTICLE_FIELDS = [
+    'topic', 'title', 'description', 'source', 'url', 'publishedAt',
+    'sentiment', 'confidence', 'positive_keywords', 'negative_keywords', 'duplicate_count'
+]
+
+# format -> (mime type, ekstensi file)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet')
+}
+
+# Jumlah baris per row group Parquet (batas memori writer)
+PARQUET_BATCH_ROWS = 5000
+
+
+def article_row(topic, article):
+    """Baris output datar untuk satu artikel yang sudah dianalisis"""
+    keywords = article.get('keywords', {})
+    return {
+        'topic': topic,
+        'title': article.get('title', ''),
+        'description': article.get('description', ''),
+        'source': article.get('source', ''),
+        'url': article.get('url', ''),
+        'publishedAt': article.get('publishedAt', ''),
+        'sentiment': article['sentiment'],
+        'confidence': article.get('confidence', 0),
+        'positive_keywords': keywords.get('positive', []),
+        'negative_keywords': keywords.get('negative', []),
+        'duplicate_count': article.get('duplicate_count', 0)
+    }
+
+
+def parquet_available():
+    """True bila pyarrow terpasang"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def available_formats():
+    """Format export yang bisa dipakai di environment ini"""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet' or parquet_available()]
+
+
+class JSONLWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, row):
+        self.stream.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+    def close(self):
+        pass
+
+
+class CSVWriter:
+    def __init__(self, stream, fields=ARTICLE_FIELDS):
+        self.writer = csv.DictWriter(stream, fieldnames=fields, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow({
+            key: '; '.join(value) if isinstance(value, list) else value
+            for key, value in row.items()
+        })
+
+    def close(self):
+        pass
+
+
+class ParquetWriter:
+    """Tulis baris ke Parquet per PARQUET_BATCH_ROWS baris (butuh pyarrow)"""
+
+    def __init__(self, sink, batch_rows=PARQUET_BATCH_ROWS):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Export Parquet membutuhkan pyarrow (pip install pyarrow)") from exc
+
+        self.pa = pa
+        self.schema = pa.schema([
+            ('topic', pa.string()),
+            ('title', pa.string()),
+            ('description', pa.string()),
+            ('source', pa.string()),
+            ('url', pa.string()),
+            ('publishedAt', pa.string()),
+            ('sentiment', pa.string()),
+            ('confidence', pa.float64()),
+            ('positive_keywords', pa.list_(pa.string())),
+            ('negative_keywords', pa.list_(pa.string())),
+            ('duplicate_count', pa.int64())
+        ])
+        self.writer = pq.ParquetWriter(sink, self.schema)
+        self.batch_rows = batch_rows
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def open_writer(fmt, stream):
+    """Writer untuk format tertentu; Parquet butuh stream biner, lainnya stream teks"""
+    if fmt == 'csv':
+        return CSVWriter(stream)
+    if fmt == 'jsonl':
+        return JSONLWriter(stream)
+    if fmt == 'parquet':
+        return ParquetWriter(stream)
+    raise ValueError(f"Format export tidak dikenal: {fmt}")
+
+
+def write_articles(writer, topic, articles):
+    """Alirkan artikel ke writer satu baris sekaligus"""
+    for article in articles:
+        writer.write(article_row(topic, article))
+
+
+def export_articles(topic, articles, fmt):
+    """Seluruh export sebagai bytes (untuk tombol download)"""
+    buffer = io.BytesIO()
+
+    if fmt == 'parquet':
+        writer = open_writer(fmt, buffer)
+        write_articles(writer, topic, articles)
+        writer.close()
+    else:
+        stream = io.TextIOWrapper(buffer, encoding='utf-8', newline='', write_through=True)
+        writer = open_writer(fmt, stream)
+        write_articles(writer, topic, articles)
+        writer.close()
+        stream.detach()
+
+    return buffer.getvalue()
+
+
+def build_report(topic, summary):
+    """Laporan teks ringkas hasil analisis"""
+    return f"""SENTIMENT ANALYSIS REPORT
+========================
+Topik: {topic.upper()}
+Tanggal: {datetime.now().strftime('%d %B %Y %H:%M')}
+
+RINGKASAN:
+- Total: {summary['total']}
+- Trend: {summary['overall_trend']}
+
+DISTRIBUSI:
+- Positif: {summary['positive_count']} ({summary['positive_pct']:.1f}%)
+- Negatif: {summary['negative_count']} ({summary['negative_pct']:.1f}%)
+- Netral: {summary['neutral_count']} ({summary['neutral_pct']:.1f}%)
+"""
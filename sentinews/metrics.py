@@ -0,0 +1,193 @@
+"""Metrik gaya Prometheus (counter & histogram) tanpa dependensi tambahan
+
+Semua modul engine mencatat ke REGISTRY bersama; render() menghasilkan format
+teks exposition Prometheus, dan start_metrics_server() melayaninya di
+/metrics untuk di-scrape.
+
+    with stage('scoring'):
+        analyzer.analyze_batch(articles)
+"""
+from contextlib import contextmanager
+import bisect
+import threading
+import time
+
+# Batas bucket histogram durasi (detik)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    )
+    return '{' + pairs + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Counter monotonic per kombinasi label"""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple((name, labels.get(name, '')) for name in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def collect(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, key, value
+
+
+class Histogram:
+    """Histogram kumulatif (bucket, _sum, _count) per kombinasi label"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple((name, labels.get(name, '')) for name in self.labelnames)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Ukur durasi blok `with` lalu catat ke histogram"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def collect(self):
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                yield self.name + '_bucket', key + (('le', _format_value(bound)),), cumulative
+            yield self.name + '_sum', key, total
+            yield self.name + '_count', key, cumulative
+
+
+class MetricsRegistry:
+    """Kumpulan metrik bernama; counter()/histogram() idempoten per nama"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self):
+        """Teks exposition Prometheus untuk semua metrik"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.collect():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'sentinews_stage_seconds', 'Durasi tiap tahap pipeline (fetch, dedup, scoring, summary, render)',
+    ['stage']
+)
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    'sentinews_cache_lookups_total', 'Lookup cache menurut hasil (hit/miss/coalesced)', ['cache', 'result']
+)
+
+
+def stage(name):
+    """Context manager span untuk satu tahap pipeline"""
+    return STAGE_SECONDS.time(stage=name)
+
+
+METRICS_HOST = '127.0.0.1'
+
+
+def start_metrics_server(port, host=METRICS_HOST, registry=REGISTRY):
+    """Layani /metrics di thread daemon; kembalikan server (panggil shutdown() untuk berhenti)
+
+    Default hanya localhost; host='0.0.0.0' (semua interface) harus diminta eksplisit.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
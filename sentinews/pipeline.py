@@ -0,0 +1,448 @@
+"""Pipeline fetch -> dedup -> skor -> ringkasan"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import time
+
+from .client import NewsAPIClient
+from .dedup import NEAR_DUPLICATE_THRESHOLD, NearDuplicateDetector
+from .metrics import stage
+from .records import ArticleRecord
+
+# Batas halaman per panggilan provider dalam mode deep fetch
+DEEP_FETCH_MAX_PAGES = 4
+
+# Bahasa berita per pilihan news_type (sama dengan plan_provider_calls)
+NEWS_TYPE_LANGUAGES = {'international': ('en',), 'local': ('id',), 'both': ('en', 'id')}
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+def plan_provider_calls(client, query, news_type='both', since=None):
+    """Daftar panggilan provider (label, fungsi, kwargs) sesuai urutan merge
+    
+    since ('YYYY-MM-DDTHH:MM:SSZ', atau dict {(provider, bahasa): waktu} seperti
+    ArticleStore.watermarks): hanya berita yang terbit sejak waktu itu. Filter
+    diterapkan client pada respons (yang tetap di-cache utuh), jadi menghemat
+    skoring & penyimpanan, bukan panggilan provider.
+    """
+    calls = []
+    
+    if news_type in ['international', 'both']:
+        # NewsData.io & GNews (English)
+        calls.append(('NewsData.io (en)', client.fetch_newsdata_io,
+                      {'query': query, 'language': 'en', 'max_results': 50}))
+        calls.append(('GNews (en)', client.fetch_gnews,
+                      {'query': query, 'language': 'en', 'max_results': 50}))
+    
+    if news_type in ['local', 'both']:
+        # GNews & NewsData.io (Indonesia)
+        calls.append(('GNews (id)', client.fetch_gnews,
+                      {'query': query, 'language': 'id', 'country': 'id', 'max_results': 50}))
+        calls.append(('NewsData.io (id)', client.fetch_newsdata_io,
+                      {'query': query, 'language': 'id', 'max_results': 50}))
+    
+    if since:
+        for _, fetch, kwargs in calls:
+            call_since = (since.get((paged_fetch(client, fetch)[0], kwargs['language']))
+                          if isinstance(since, dict) else since)
+            if call_since:
+                kwargs['since'] = call_since
+    
+    return calls
+
+
+def paged_fetch(client, fetch):
+    """(provider, versi berhalaman) dari fungsi fetch di plan_provider_calls"""
+    return {
+        'fetch_newsdata_io': ('NewsData.io', client.fetch_newsdata_page),
+        'fetch_gnews': ('GNews', client.fetch_gnews_page)
+    }[fetch.__name__]
+
+
+def deep_fetch_allowed(client, provider):
+    """Halaman tambahan hanya diminta selama kuota harian provider belum menipis"""
+    if client.quota is None:
+        return True
+    status = client.quota.status().get(provider)
+    return status is None or status['remaining'] > status['limit'] * client.quota.low_ratio
+
+
+def aggregate_news(query, news_type='both', max_articles=100, concurrent=True, client=None,
+                   similarity_threshold=NEAR_DUPLICATE_THRESHOLD, max_pages=1, planner=None, since=None):
+    """Mengumpulkan berita dari berbagai sumber API
+    
+    Dengan concurrent=True semua panggilan provider/bahasa berjalan bersamaan,
+    sehingga latensi mendekati provider paling lambat. Hasil tetap digabung
+    sesuai urutan plan_provider_calls agar deterministik. Berita hampir sama
+    (similarity >= similarity_threshold) digabung oleh NearDuplicateDetector.
+    
+    max_pages > 1 (deep fetch) mengikuti halaman berikutnya tiap provider dan
+    berhenti begitu max_articles berita unik terkumpul; urutan hasil mengikuti
+    halaman yang selesai lebih dulu. Dengan planner (ProviderPlanner), panggilan
+    diurutkan menurut riwayat yield/latensi dan sisanya dilewati begitu target
+    tercapai; urutan hasil juga mengikuti batch yang selesai lebih dulu.
+    
+    since (lihat plan_provider_calls) membatasi hasil ke berita yang terbit
+    sejak waktu itu.
+    """
+    if client is None:
+        client = NewsAPIClient()
+    
+    if max_pages > 1 or planner is not None:
+        detector = NearDuplicateDetector(similarity_threshold)
+        unique_articles = []
+        
+        batches = stream_provider_batches(query, news_type, client, max_pages=max_pages, planner=planner,
+                                          remaining=lambda: max_articles - len(unique_articles), since=since)
+        for _, articles in batches:
+            with stage('dedup'):
+                unique_articles.extend(
+                    article for article in articles
+                    if article.get('title', '').strip() and detector.add(article)
+                )
+            if len(unique_articles) >= max_articles:
+                break
+        
+        return [ArticleRecord(article) for article in unique_articles[:max_articles]]
+    
+    calls = plan_provider_calls(client, query, news_type, since)
+    
+    with stage('fetch'):
+        if concurrent and len(calls) > 1:
+            with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+                futures = [executor.submit(fetch, **kwargs) for _, fetch, kwargs in calls]
+                results = [future.result() for future in futures]
+        else:
+            results = []
+            for idx, (_, fetch, kwargs) in enumerate(calls):
+                if idx > 0:
+                    time.sleep(0.5)
+                results.append(fetch(**kwargs))
+    
+    all_articles = [article for articles in results for article in articles]
+    
+    # Hapus duplikat (judul kosong dibuang, salinan syndicated digabung)
+    detector = NearDuplicateDetector(similarity_threshold)
+    with stage('dedup'):
+        unique_articles = detector.collapse(
+            article for article in all_articles if article.get('title', '').strip()
+        )
+    
+    return [ArticleRecord(article) for article in unique_articles[:max_articles]]
+
+
+def _timed(client, fetch, kwargs):
+    """(hasil, detik, entri fetch_log panggilan ini atau None)"""
+    before = client.last_fetch()
+    start = time.perf_counter()
+    result = fetch(**kwargs)
+    seconds = time.perf_counter() - start
+    entry = client.last_fetch()
+    return result, seconds, entry if entry is not before else None
+
+
+def stream_provider_batches(query, news_type='both', client=None, max_pages=1,
+                            planner=None, remaining=None, since=None, sources=False):
+    """Yield (label, articles) per panggilan provider, urut sesuai selesainya
+    
+    Dengan max_pages > 1, halaman berikutnya diminta begitu cursor/nomor
+    halamannya diketahui (sebelum batch ini diproses konsumen), paralel antar
+    provider, selama kuota provider belum menipis.
+    
+    Dengan planner (ProviderPlanner) & remaining (callable: jumlah artikel unik
+    yang masih dibutuhkan konsumen), panggilan dijalankan per gelombang sesuai
+    urutan planner; panggilan yang tidak diperlukan lagi dicatat 'skipped' di
+    fetch_log client.
+    
+    sources=True: yield (label, articles, (provider, bahasa)).
+    """
+    if client is None:
+        client = NewsAPIClient()
+    calls = plan_provider_calls(client, query, news_type, since)
+    if not calls:
+        return
+    
+    needed = remaining if remaining is not None else (lambda: float('inf'))
+    queue = planner.order(query, calls) if planner is not None else list(calls)
+    pending = {}
+    executor = ThreadPoolExecutor(max_workers=len(calls))
+    
+    def launch():
+        wave = planner.next_wave(query, queue, needed()) if planner is not None else list(queue)
+        for label, fetch, kwargs in wave:
+            queue.remove((label, fetch, kwargs))
+            provider, fetch_page = paged_fetch(client, fetch)
+            if max_pages > 1:
+                fetch = fetch_page
+            pending[executor.submit(_timed, client, fetch, kwargs)] = (label, provider, fetch, kwargs, 1)
+    
+    try:
+        launch()
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            
+            # Planner belajar dari request sungguhan saja (bukan cache/kuota)
+            # dengan jumlah artikel mentah sebelum filter since & dedup; dicatat
+            # untuk semua yang selesai, juga bila konsumen berhenti lebih awal
+            if planner is not None:
+                for future in done:
+                    label, _, _, _, page_number = pending[future]
+                    _, seconds, entry = future.result()
+                    if page_number == 1 and entry and entry['status'] in ('miss', 'error'):
+                        planner.record(query, label, entry['count'], seconds)
+            
+            for future in done:
+                label, provider, fetch, kwargs, page_number = pending.pop(future)
+                result = future.result()[0]
+                
+                if max_pages > 1:
+                    articles, next_page = result
+                    if (next_page is not None and page_number < max_pages and needed() > 0
+                            and deep_fetch_allowed(client, provider)):
+                        next_future = executor.submit(_timed, client, fetch, {**kwargs, 'page': next_page})
+                        pending[next_future] = (label, provider, fetch, kwargs, page_number + 1)
+                else:
+                    articles = result
+                
+                batch_label = label if page_number == 1 else f"{label} hal. {page_number}"
+                if sources:
+                    yield batch_label, articles, (provider, kwargs['language'])
+                else:
+                    yield batch_label, articles
+            
+            # Gelombang berikutnya hanya bila yang sudah jalan belum cukup
+            if not pending and queue and needed() > 0:
+                launch()
+    finally:
+        for label, fetch, kwargs in queue:
+            client.log_skipped(paged_fetch(client, fetch)[0], kwargs['language'], 'target artikel tercapai')
+        # Konsumen berhenti lebih awal: jangan tunggu provider yang masih lambat
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def stream_news(query, news_type='both', max_articles=100, client=None, detector=None, max_pages=1):
+    """Yield artikel unik satu per satu begitu provider mana pun merespons
+    
+    Berbeda dari aggregate_news, urutan mengikuti provider yang paling cepat,
+    sehingga artikel pertama sudah bisa diskor sebelum provider paling lambat
+    selesai. Berhenti setelah max_articles artikel unik.
+    """
+    if detector is None:
+        detector = NearDuplicateDetector()
+    yielded = 0
+    
+    for _, articles in stream_provider_batches(query, news_type, client, max_pages=max_pages):
+        for article in articles:
+            if not article.get('title', '').strip() or not detector.add(article):
+                continue
+            
+            yield article
+            yielded += 1
+            
+            if yielded >= max_articles:
+                return
+
+
+def stream_scored_batches(query, news_type='both', max_articles=100, client=None,
+                          analyzer=None, detector=None, max_pages=1, planner=None, store=None,
+                          local_first=True):
+    """Yield (label, artikel_terskor) per batch provider begitu batch itu tiba
+
+    Untuk render bertahap: setiap batch langsung di-dedup & diskor tanpa
+    menunggu provider lain. Skor ditulis ke dict artikel itu sendiri, sehingga
+    duplicate_count yang ditambah detector dari batch berikutnya tetap
+    terlihat di hasil akhir. Artikel berupa ArticleRecord yang kontennya
+    dibuang setelah diskor (dan disimpan ke store).
+
+    Dengan store (ArticleStore), hanya berita sejak watermark topik per
+    provider & bahasa yang dipakai, hanya artikel baru yang diskor, semua
+    artikel unik dari setiap panggilan disimpan (watermark baru maju setelah
+    itu), dan bila masih kurang dari max_articles sisanya diambil dari arsip
+    (batch 'Arsip lokal').
+    Dengan local_first, query yang arsipnya cukup segar & lengkap
+    (ArticleStore.local_answer) dijawab dari arsip tanpa memanggil provider.
+    Jawaban & tambahan dari arsip hanya memakai artikel berbahasa news_type.
+    """
+    if analyzer is None:
+        from .analyzer import SentimentAnalyzer
+        analyzer = SentimentAnalyzer()
+    if detector is None:
+        detector = NearDuplicateDetector()
+    emitted = 0
+    unique_seen = 0  # termasuk artikel unik di atas max_articles, untuk statistik planner
+
+    languages = NEWS_TYPE_LANGUAGES[news_type]
+    local = store.local_answer(query, max_articles, languages) if store is not None and local_first else None
+    if local is not None:
+        if client is not None:
+            for _, fetch, kwargs in plan_provider_calls(client, query, news_type):
+                client.log_skipped(paged_fetch(client, fetch)[0], kwargs['language'], 'dijawab dari arsip lokal')
+        yield 'Arsip lokal', [article for article in local if detector.add(article)]
+        return
+
+    # Watermark per (provider, bahasa): ganti news_type atau provider yang
+    # dilewati planner tidak membuat berita lama provider lain ikut tersaring
+    since = store.watermarks(query) if store is not None else None
+    batches = stream_provider_batches(query, news_type, client, max_pages=max_pages, planner=planner,
+                                      remaining=lambda: max_articles - unique_seen, since=since,
+                                      sources=True)
+    emitted_articles = []
+    for label, articles, (provider, language) in batches:
+        with stage('dedup'):
+            unique = [
+                record for record in map(ArticleRecord, articles)
+                if record.get('title', '').strip() and detector.add(record)
+            ]
+        unique_seen += len(unique)
+        # Dengan store semua artikel unik diskor & disimpan, bukan hanya yang
+        # ditampilkan: yang lebih lama dari watermark tidak akan diambil lagi
+        kept = unique if store is not None else unique[:max_articles - emitted]
+        new = store.restore(kept) if store is not None else kept
+
+        with stage('scoring'):
+            for article, (sentiment, confidence, keywords) in zip(new, analyzer.score_articles(new)):
+                article.update(sentiment=sentiment, confidence=confidence, keywords=keywords)
+
+        fresh = kept[:max_articles - emitted]
+        if store is not None:
+            store.add(query, kept)
+            store.mark(query, provider, language, articles)
+            emitted_articles.extend(fresh)
+        for article in kept:
+            article.compact()
+
+        emitted += len(fresh)
+        yield label, fresh
+
+        if emitted >= max_articles:
+            return
+
+    if store is not None:
+        archived = [
+            article for article in store.articles(query, limit=max_articles, exclude=emitted_articles,
+                                                  languages=languages)
+            if detector.add(article)
+        ]
+        if archived:
+            yield 'Arsip lokal', archived[:max_articles - emitted]
+
+
+def analyze_topic(query, news_type='both', max_articles=100, client=None, analyzer=None,
+                  max_pages=1, planner=None, store=None, local_first=True):
+    """Fetch, skor & ringkas satu topik tanpa UI (mis. untuk pemanasan background)
+
+    Hasilnya berbentuk sama dengan hasil analisis di app: dict berisi
+    'analyzed_articles', 'summary' & 'fetch_log'; None bila tidak ada berita.
+    """
+    if client is None:
+        client = NewsAPIClient()
+
+    batches = stream_scored_batches(query, news_type, max_articles, client=client, analyzer=analyzer,
+                                    max_pages=max_pages, planner=planner, store=store, local_first=local_first)
+    analyzed_articles = [article for _, batch in batches for article in batch]
+    if not analyzed_articles:
+        return None
+
+    return {
+        'analyzed_articles': analyzed_articles,
+        'summary': create_sentiment_summary(analyzed_articles),
+        'fetch_log': client.fetch_log
+    }
+
+
+def create_sentiment_summary(analyzed_articles):
+    """Membuat ringkasan sentimen"""
+    if not analyzed_articles:
+        return None
+    
+    with stage('summary'):
+        total = len(analyzed_articles)
+        sentiments = [a['sentiment'] for a in analyzed_articles]
+        avg_confidence = sum(a.get('confidence', 0) for a in analyzed_articles) / total
+        duplicate_counts = [a.get('duplicate_count', 0) for a in analyzed_articles]
+        
+        return build_summary(
+            total,
+            sentiments.count('positive'),
+            sentiments.count('negative'),
+            sentiments.count('neutral'),
+            avg_confidence,
+            duplicate_clusters=sum(1 for count in duplicate_counts if count),
+            duplicates_removed=sum(duplicate_counts)
+        )
+
+
+def build_summary(total, positive_count, negative_count, neutral_count, avg_confidence,
+                  duplicate_clusters=0, duplicates_removed=0):
+    """Hitung persentase & trend keseluruhan dari jumlah per sentimen"""
+    positive_pct = (positive_count / total) * 100
+    negative_pct = (negative_count / total) * 100
+    neutral_pct = (neutral_count / total) * 100
+    
+    if positive_pct > negative_pct + 15:
+        overall_trend = "SANGAT POSITIF"
+        trend_emoji = "📈🚀"
+    elif positive_pct > negative_pct + 5:
+        overall_trend = "POSITIF"
+        trend_emoji = "📈"
+    elif negative_pct > positive_pct + 15:
+        overall_trend = "SANGAT NEGATIF"
+        trend_emoji = "📉💔"
+    elif negative_pct > positive_pct + 5:
+        overall_trend = "NEGATIF"
+        trend_emoji = "📉"
+    else:
+        overall_trend = "NETRAL"
+        trend_emoji = "➡️"
+    
+    return {
+        'total': total,
+        'positive_count': positive_count,
+        'negative_count': negative_count,
+        'neutral_count': neutral_count,
+        'positive_pct': positive_pct,
+        'negative_pct': negative_pct,
+        'neutral_pct': neutral_pct,
+        'overall_trend': overall_trend,
+        'trend_emoji': trend_emoji,
+        'avg_confidence': avg_confidence,
+        'duplicate_clusters': duplicate_clusters,
+        'duplicates_removed': duplicates_removed
+    }
+
+
+class SentimentAggregator:
+    """Ringkasan sentimen berjalan: diperbarui per artikel dalam O(1)"""
+    
+    def __init__(self, detector=None):
+        # detector: NearDuplicateDetector milik stream_news, untuk statistik duplikat
+        self.detector = detector
+        self.total = 0
+        self.counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+        self.confidence_sum = 0.0
+    
+    def add(self, article):
+        """Masukkan satu artikel yang sudah diskor"""
+        self.total += 1
+        self.counts[article['sentiment']] += 1
+        self.confidence_sum += article.get('confidence', 0)
+    
+    def consume(self, articles):
+        """Teruskan artikel dari generator sambil memperbarui ringkasan"""
+        for article in articles:
+            self.add(article)
+            yield article
+    
+    def summary(self):
+        """Ringkasan dalam format create_sentiment_summary (None bila kosong)"""
+        if not self.total:
+            return None
+        
+        return build_summary(
+            self.total,
+            self.counts['positive'],
+            self.counts['negative'],
+            self.counts['neutral'],
+            self.confidence_sum / self.total,
+            **(self.detector.stats() if self.detector is not None else {})
+        )
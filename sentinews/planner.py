@@ -0,0 +1,110 @@
+"""Perencana urutan panggilan provider berdasarkan riwayat yield & latensi"""
+import os
+import sqlite3
+import threading
+import time
+
+from .cache import CACHE_DIR
+
+# ============================================================================
+# PROVIDER PLANNER CLASS
+# ============================================================================
+PLANNER_PRIOR_YIELD = 30.0     # artikel per panggilan sebelum ada riwayat
+PLANNER_PRIOR_LATENCY = 1.0    # detik per panggilan sebelum ada riwayat
+PLANNER_SMOOTHING = 0.3        # bobot observasi terbaru (EWMA)
+PLANNER_SAFETY_MARGIN = 1.2    # gelombang pertama menargetkan 120% kebutuhan
+
+
+class ProviderPlanner:
+    """Urutkan panggilan provider dan tentukan berapa yang perlu dijalankan.
+
+    Setiap panggilan (label plan_provider_calls, mis. 'GNews (id)') punya
+    rata-rata bergerak artikel yang dikembalikan & latensinya, per topik
+    dan global. Panggilan dengan artikel/detik tertinggi dijalankan dulu, dalam
+    gelombang yang cukup untuk memenuhi target; sisanya hanya dijalankan bila
+    gelombang sebelumnya kurang.
+    """
+
+    def __init__(self, path=None, smoothing=PLANNER_SMOOTHING, safety_margin=PLANNER_SAFETY_MARGIN):
+        self.path = path or os.path.join(CACHE_DIR, 'planner.sqlite')
+        self.smoothing = smoothing
+        self.safety_margin = safety_margin
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS call_stats (
+                    query TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    yield_avg REAL NOT NULL,
+                    latency_avg REAL NOT NULL,
+                    samples INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (query, label)
+                )
+            """)
+
+    def estimate(self, query, label):
+        """(artikel, detik) yang diharapkan dari satu panggilan"""
+        with self._lock:
+            rows = dict(
+                (row[0], row[1:]) for row in self._conn.execute(
+                    "SELECT query, yield_avg, latency_avg FROM call_stats "
+                    "WHERE label = ? AND query IN (?, '')", (label, query.strip().lower())
+                )
+            )
+
+        # Riwayat topik ini lebih relevan daripada rata-rata semua topik
+        return rows.get(query.strip().lower()) or rows.get('') or (PLANNER_PRIOR_YIELD, PLANNER_PRIOR_LATENCY)
+
+    def order(self, query, calls):
+        """Panggilan diurutkan dari artikel per detik tertinggi"""
+        def rate(call):
+            expected_yield, latency = self.estimate(query, call[0])
+            return expected_yield / max(latency, 0.05)
+
+        return sorted(calls, key=rate, reverse=True)
+
+    def next_wave(self, query, calls, needed):
+        """Awal daftar calls (sudah diurutkan) yang perkiraan yield-nya cukup untuk `needed`"""
+        wave = []
+        expected = 0.0
+
+        for call in calls:
+            if wave and expected >= needed * self.safety_margin:
+                break
+            wave.append(call)
+            expected += self.estimate(query, call[0])[0]
+
+        return wave
+
+    def record(self, query, label, count, seconds):
+        """Perbarui rata-rata untuk topik ini dan untuk semua topik
+
+        count: artikel yang dikembalikan provider (sebelum filter since & dedup),
+        hanya untuk request yang benar-benar dikirim (bukan dari cache).
+        """
+        now = time.time()
+
+        with self._lock, self._conn:
+            for key in (query.strip().lower(), ''):
+                row = self._conn.execute(
+                    "SELECT yield_avg, latency_avg, samples FROM call_stats WHERE query = ? AND label = ?",
+                    (key, label)
+                ).fetchone()
+
+                if row is None:
+                    values = (count, seconds, 1)
+                else:
+                    alpha = self.smoothing
+                    values = (row[0] + alpha * (count - row[0]),
+                              row[1] + alpha * (seconds - row[1]),
+                              row[2] + 1)
+
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO call_stats "
+                    "(query, label, yield_avg, latency_avg, samples, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, label, *values, now)
+                )
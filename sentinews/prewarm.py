@@ -0,0 +1,292 @@
+"""Pemanasan hasil topik preset & watchlist di background"""
+import logging
+import random
+import threading
+import time
+
+from .pipeline import analyze_topic, create_sentiment_summary, paged_fetch, plan_provider_calls
+from .quota import QUOTA_BURST
+from .results import ResultCache
+from .topics import PRESET_TICKERS, TICKER_ALIASES
+from .watchlist import fetch_watchlist_articles, plan_watchlist_calls, route_watchlist
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# PREWARM SCHEDULER CLASS
+# ============================================================================
+PREWARM_QUOTA_SHARE = 0.25          # bagian kuota harian tiap provider untuk pemanasan
+PREWARM_QUOTA_RESERVE = 0.5         # job dilewati bila sisa kuota harian < 50% limit
+PREWARM_MIN_TOKENS = QUOTA_BURST / 2  # token burst yang selalu disisakan untuk request interaktif
+PREWARM_MIN_INTERVAL = 15 * 60
+PREWARM_START_DELAY = 30            # detik sebelum siklus pertama (maks., diacak)
+PREWARM_JITTER = 0.2                # interval ±20%, jeda acak antar job
+PREWARM_JOB_GAP = 10                # jeda acak maks. (detik) antar job dalam satu siklus
+PREWARM_IDLE_WAIT = 15              # tunggu selama ada analisis interaktif yang berjalan
+PREWARM_MAX_BACKOFF = 8             # kelipatan interval maks. setelah kegagalan beruntun
+PREWARM_MAX_SERVE_AGE = 60 * 60     # umur maks. hasil hangat yang masih dilayani saat diklik;
+                                    # interval siklus (plus jitter) tidak boleh melebihinya
+
+# Pengaturan default app; hasil hangat disimpan di key ResultCache yang sama
+PREWARM_NEWS_TYPE = 'both'
+PREWARM_MAX_ARTICLES = 100
+
+
+def topic_result_key(query, news_type=PREWARM_NEWS_TYPE, max_articles=PREWARM_MAX_ARTICLES):
+    """Key ResultCache hasil topik dengan pengaturan default app (1 halaman, arsip lokal aktif)"""
+    return ResultCache.make_key(query, news_type, max_articles, 1, True)
+
+
+def watchlist_result_key(tickers, news_type=PREWARM_NEWS_TYPE, max_articles=PREWARM_MAX_ARTICLES):
+    return ('watchlist', tuple(tickers), news_type, max_articles)
+
+
+def provider_calls(client, calls):
+    """Jumlah panggilan per provider dari daftar (label, fetch, kwargs)"""
+    counts = {}
+    for _, fetch, _ in calls:
+        provider = paged_fetch(client, fetch)[0]
+        counts[provider] = counts.get(provider, 0) + 1
+    return counts
+
+
+class PrewarmScheduler:
+    """Thread daemon yang menyegarkan hasil topik preset & watchlist.
+    
+    Hasil disimpan di ResultCache dengan key yang sama seperti klik di app
+    (TTL = interval siklus, maks. PREWARM_MAX_SERVE_AGE), sehingga preset
+    langsung tampil dari data hangat. Topik preset yang punya ticker
+    (topic_tickers) dibuat dari satu fetch watchlist bersama, bukan fetch
+    per topik.
+    Interval dipilih agar pemanasan memakai paling banyak PREWARM_QUOTA_SHARE
+    kuota harian tiap provider, dan selalu cukup pendek agar hasil hangat
+    diperbarui sebelum PREWARM_MAX_SERVE_AGE; job yang tidak muat di kuota
+    itu dilewati (dicatat di log). Job juga dilewati bila sisa kuota harian di
+    bawah cadangan, dan ditunda selama ada analisis interaktif yang sedang
+    berjalan atau token burst belum cukup (PREWARM_MIN_TOKENS selalu disisakan);
+    setelah kegagalan (error/kuota habis) interval diperpanjang bertahap.
+    """
+    
+    def __init__(self, client_factory, result_cache, topics=(), tickers=(), analyzer=None, store=None,
+                 news_type=PREWARM_NEWS_TYPE, max_articles=PREWARM_MAX_ARTICLES, share=PREWARM_QUOTA_SHARE,
+                 topic_tickers=None, seed=None):
+        self.client_factory = client_factory
+        self.result_cache = result_cache
+        self.topics = list(topics)
+        self.tickers = list(tickers)
+        self.analyzer = analyzer
+        self.store = store
+        self.news_type = news_type
+        self.max_articles = max_articles
+        self.share = share
+        self.topic_tickers = PRESET_TICKERS if topic_tickers is None else topic_tickers
+        self.failures = 0
+        self.jobs = {}
+        self.unsupported = []
+        self._rng = random.Random(seed)
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def _cycle_seconds(self, client, counts):
+        """Detik per siklus agar tiap provider memakai <= share kuota hariannya"""
+        limits = client.quota.limits if client.quota is not None else {}
+        seconds = max(
+            (24 * 60 * 60 * count / (limits[provider] * self.share)
+             for provider, count in counts.items() if provider in limits),
+            default=PREWARM_MIN_INTERVAL
+        )
+        return max(seconds, PREWARM_MIN_INTERVAL)
+    
+    def plan(self, client):
+        """(job yang dijalankan, nama job yang tidak muat di kuota, interval siklus)
+        
+        Job diambil sesuai urutan selama interval siklusnya (plus jitter) masih
+        <= PREWARM_MAX_SERVE_AGE; tanpa job yang muat, siklus berikutnya dicek
+        lagi setelah PREWARM_MAX_SERVE_AGE.
+        """
+        jobs, unsupported, counts = [], [], {}
+        for job in self._job_list(client):
+            merged = dict(counts)
+            for provider, count in provider_calls(client, job[1]).items():
+                merged[provider] = merged.get(provider, 0) + count
+            if self._cycle_seconds(client, merged) * (1 + PREWARM_JITTER) > PREWARM_MAX_SERVE_AGE:
+                unsupported.append(job[0])
+                continue
+            jobs.append(job)
+            counts = merged
+        
+        interval = self._cycle_seconds(client, counts) if jobs else PREWARM_MAX_SERVE_AGE
+        return jobs, unsupported, interval
+    
+    def interval(self, client):
+        """Detik per siklus untuk job yang muat di kuota (lihat plan)"""
+        return self.plan(client)[2]
+    
+    def quota_allows(self, client, calls):
+        """False bila sisa kuota harian salah satu provider job ini di bawah cadangan"""
+        if client.quota is None:
+            return True
+        status = client.quota.status()
+        return all(
+            status[provider]['remaining'] >= status[provider]['limit'] * PREWARM_QUOTA_RESERVE
+            for provider in provider_calls(client, calls) if provider in status
+        )
+
+    def token_wait(self, client, calls):
+        """Detik sampai token burst cukup untuk job ini plus PREWARM_MIN_TOKENS (0 = boleh jalan)"""
+        if client.quota is None:
+            return 0
+        status = client.quota.status()
+        deficit = max(
+            (count + PREWARM_MIN_TOKENS - status[provider]['tokens']
+             for provider, count in provider_calls(client, calls).items() if provider in status),
+            default=0
+        )
+        return max(deficit, 0) / client.quota.refill_per_second
+
+    def _wait_turn(self, client, calls):
+        """Tunggu sampai tidak ada analisis interaktif yang sedang dihitung dan
+        token burst cukup; False bila dihentikan"""
+        while True:
+            if self.result_cache.stats()['inflight']:
+                delay = PREWARM_IDLE_WAIT
+            else:
+                delay = self.token_wait(client, calls)
+                if not delay:
+                    return not self._stop.is_set()
+            if self._stop.wait(delay * self._rng.uniform(1, 1 + PREWARM_JITTER)):
+                return False
+
+    def shared_tickers(self):
+        """Ticker fetch watchlist bersama: watchlist + ticker topik preset"""
+        tickers = list(self.tickers)
+        for query in self.topics:
+            ticker = self.topic_tickers.get(query)
+            if ticker in TICKER_ALIASES and ticker not in tickers:
+                tickers.append(ticker)
+        return tickers
+    
+    def _job_list(self, client):
+        """(nama, calls, compute) per job; compute(client) -> {nama hasil: (key, value)}"""
+        shared = self.shared_tickers()
+        derived = [query for query in self.topics if self.topic_tickers.get(query) in shared]
+        jobs = []
+        if shared:
+            jobs.append(('watchlist' if self.tickers else 'preset',
+                         plan_watchlist_calls(client, shared, self.news_type),
+                         lambda client: self._shared_results(client, shared, derived)))
+        jobs.extend(
+            (query, plan_provider_calls(client, query, self.news_type),
+             lambda client, query=query: self._topic_results(client, query))
+            for query in self.topics if query not in derived
+        )
+        return jobs
+    
+    def _shared_results(self, client, shared, derived):
+        """Watchlist & topik preset dari satu fetch: artikel diambil & diskor sekali lalu dirutekan"""
+        calls = plan_watchlist_calls(client, shared, self.news_type)
+        analyzed = fetch_watchlist_articles(calls, self.analyzer)
+        results = {}
+        
+        if self.tickers:
+            results['watchlist'] = (
+                watchlist_result_key(self.tickers, self.news_type, self.max_articles),
+                {**route_watchlist(analyzed, self.tickers, self.max_articles), 'calls': len(calls),
+                 'fetch_log': client.fetch_log}
+            )
+        
+        routed = route_watchlist(analyzed, [self.topic_tickers[query] for query in derived],
+                                 self.max_articles)['articles']
+        for query in derived:
+            articles = routed[self.topic_tickers[query]]
+            if not articles:
+                continue
+            if self.store is not None:
+                self.store.add(query, articles)
+            results[query] = (topic_result_key(query, self.news_type, self.max_articles), {
+                'analyzed_articles': articles,
+                'summary': create_sentiment_summary(articles),
+                'fetch_log': client.fetch_log
+            })
+        
+        # Konten penuh hanya dibutuhkan untuk skoring, routing & arsip
+        for article in analyzed:
+            article.compact()
+        return results
+    
+    def _topic_results(self, client, query):
+        value = analyze_topic(query, self.news_type, self.max_articles, client=client, analyzer=self.analyzer,
+                              store=self.store, local_first=False)
+        return {query: (topic_result_key(query, self.news_type, self.max_articles), value)} if value else {}
+    
+    def run_once(self):
+        """Satu siklus: panaskan job yang muat di kuota (urutan acak); kembalikan interval siklus berikutnya"""
+        client = self.client_factory()
+        jobs, unsupported, interval = self.plan(client)
+        if unsupported != self.unsupported:
+            if unsupported:
+                logger.warning("prewarm %s: kuota %.0f%% per hari tidak cukup untuk menyegarkan tiap %d menit, "
+                               "dilewati", ', '.join(unsupported), self.share * 100, PREWARM_MAX_SERVE_AGE // 60)
+            self.unsupported = unsupported
+        for name in unsupported:
+            self.jobs[name] = {**self.jobs.get(name, {}), 'status': 'unsupported'}
+        
+        ttl = min(interval * (1 + PREWARM_JITTER) * (1 + self.failures) + PREWARM_MIN_INTERVAL,
+                  PREWARM_MAX_SERVE_AGE)
+        failed = False
+        
+        self._rng.shuffle(jobs)
+        
+        for position, (name, calls, compute) in enumerate(jobs):
+            if position and self._stop.wait(self._rng.uniform(0, PREWARM_JOB_GAP)):
+                break
+            if not self.quota_allows(client, calls):
+                logger.info("prewarm %s: kuota harian menipis, dilewati", name)
+                self.jobs[name] = {**self.jobs.get(name, {}), 'status': 'skipped'}
+                continue
+            if not self._wait_turn(client, calls):
+                break
+            
+            client = self.client_factory()
+            try:
+                results = compute(client)
+            except Exception as e:
+                logger.warning("prewarm %s: %s: %s", name, type(e).__name__, e)
+                results = {}
+            
+            errors = [entry for entry in client.fetch_log if entry['status'] in ('error', 'denied')]
+            failed = failed or bool(errors)
+            
+            if not results:
+                self.jobs[name] = {**self.jobs.get(name, {}), 'status': 'error' if errors else 'empty'}
+                continue
+            
+            warmed_at = time.time()
+            for result_name, (key, value) in results.items():
+                value['warmed_at'] = warmed_at
+                self.result_cache.put(key, value, ttl=ttl)
+                self.jobs[result_name] = {'status': 'ok', 'warmed_at': warmed_at, 'errors': len(errors)}
+            logger.info("prewarm %s: %d hasil, %d panggilan provider, %d gagal", name, len(results),
+                        len(client.fetch_log), len(errors))
+        
+        self.failures = min(self.failures + 1, PREWARM_MAX_BACKOFF - 1) if failed else 0
+        return interval * (1 + self.failures)
+    
+    def _run(self):
+        delay = self._rng.uniform(0, PREWARM_START_DELAY)
+        while not self._stop.wait(delay):
+            try:
+                interval = self.run_once()
+            except Exception:
+                logger.exception("prewarm: siklus gagal")
+                interval = PREWARM_MIN_INTERVAL * (1 + self.failures)
+                self.failures = min(self.failures + 1, PREWARM_MAX_BACKOFF - 1)
+            delay = interval * self._rng.uniform(1 - PREWARM_JITTER, 1 + PREWARM_JITTER)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='sentinews-prewarm', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
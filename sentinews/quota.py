@@ -0,0 +1,125 @@
+"""Penjadwal kuota harian per provider"""
+from datetime import datetime, timezone
+import os
+import sqlite3
+import threading
+import time
+
+from .cache import CACHE_DIR
+
+# ============================================================================
+# QUOTA SCHEDULER CLASS
+# ============================================================================
+PROVIDER_DAILY_LIMITS = {'NewsData.io': 200, 'GNews': 100}
+QUOTA_BURST = 10
+QUOTA_REFILL_PER_SECOND = 0.2  # 1 token tiap 5 detik
+QUOTA_LOW_RATIO = 0.2
+
+
+class QuotaScheduler:
+    """Penjadwal kuota per provider: token bucket + counter harian persisten.
+    
+    Disimpan di SQLite sehingga tetap berlaku setelah restart dan bersama
+    untuk semua sesi/proses. Counter harian direset setiap pergantian hari UTC.
+    """
+    
+    ALLOW = 'allow'
+    DOWNGRADE = 'downgrade'
+    DENY = 'deny'
+    
+    def __init__(self, path=None, limits=None, burst=QUOTA_BURST,
+                 refill_per_second=QUOTA_REFILL_PER_SECOND, low_ratio=QUOTA_LOW_RATIO):
+        self.path = path or os.path.join(CACHE_DIR, 'quota.sqlite')
+        self.limits = dict(limits or PROVIDER_DAILY_LIMITS)
+        self.burst = burst
+        self.refill_per_second = refill_per_second
+        self.low_ratio = low_ratio
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False,
+                                     isolation_level=None)
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS quota (
+                    provider TEXT PRIMARY KEY,
+                    day TEXT NOT NULL,
+                    used INTEGER NOT NULL,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+    
+    @staticmethod
+    def _today():
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    
+    def _load(self, provider, now):
+        """Baca state provider (sudah di-refill & direset harian bila perlu)"""
+        row = self._conn.execute(
+            "SELECT day, used, tokens, updated_at FROM quota WHERE provider = ?", (provider,)
+        ).fetchone()
+        
+        if row is None:
+            return 0, float(self.burst)
+        
+        day, used, tokens, updated_at = row
+        if day != self._today():
+            used = 0
+        tokens = min(self.burst, tokens + (now - updated_at) * self.refill_per_second)
+        return used, tokens
+    
+    def acquire(self, provider, has_stale=False):
+        """Putuskan nasib satu request sebelum dikirim.
+        
+        ALLOW     : kirim request (token & kuota harian terpakai satu)
+        DOWNGRADE : layani dari cache stale, tidak memakai kuota
+        DENY      : tolak, tidak ada data cadangan
+        """
+        limit = self.limits.get(provider)
+        if limit is None:
+            return self.ALLOW
+        
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                used, tokens = self._load(provider, now)
+                remaining = limit - used
+                low = remaining <= limit * self.low_ratio
+                
+                if remaining <= 0 or tokens < 1 or (low and has_stale):
+                    decision = self.DOWNGRADE if has_stale else self.DENY
+                else:
+                    decision = self.ALLOW
+                    used += 1
+                    tokens -= 1
+                
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO quota (provider, day, used, tokens, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (provider, self._today(), used, tokens, now)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        
+        return decision
+    
+    def status(self):
+        """Sisa kuota harian & token burst untuk setiap provider"""
+        now = time.time()
+        result = {}
+        
+        with self._lock:
+            for provider, limit in self.limits.items():
+                used, tokens = self._load(provider, now)
+                result[provider] = {
+                    'limit': limit,
+                    'used': used,
+                    'remaining': max(limit - used, 0),
+                    'tokens': tokens
+                }
+        
+        return result
@@ -0,0 +1,99 @@
+"""Representasi artikel yang hemat memori"""
+from collections.abc import MutableMapping
+import sys
+
+# ============================================================================
+# ARTICLE RECORD CLASS
+# ============================================================================
+# Urutan field = urutan key dict artikel dari client + hasil skoring
+ARTICLE_FIELDS = ('title', 'description', 'content', 'source', 'url', 'publishedAt', 'image', 'language',
+                  'sentiment', 'confidence', 'keywords', 'duplicate_count')
+
+# String yang berulang di banyak artikel disimpan sekali (sys.intern)
+INTERNED_FIELDS = frozenset(('source', 'language', 'sentiment'))
+
+_SLOT_FIELDS = frozenset(ARTICLE_FIELDS) - {'keywords'}
+
+
+class ArticleRecord(MutableMapping):
+    """Artikel sebagai record __slots__ yang tetap bisa dipakai seperti dict.
+
+    Field tetap disimpan di slot (tanpa dict per artikel), source & sentimen
+    di-intern, dan keyword disimpan sebagai tuple; article['keywords'] tetap
+    mengembalikan {'positive': [...], 'negative': [...]}. Field lain masuk
+    dict tambahan. compact() membuang konten penuh setelah artikel diskor.
+    """
+
+    __slots__ = tuple(sorted(_SLOT_FIELDS)) + ('_keywords', '_extra')
+
+    def __init__(self, article=(), **fields):
+        self._extra = None
+        self.update(article, **fields)
+
+    def __getitem__(self, key):
+        try:
+            if key == 'keywords':
+                positive, negative = self._keywords
+                return {'positive': list(positive), 'negative': list(negative)}
+            if key in _SLOT_FIELDS:
+                return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if isinstance(value, str) and key in INTERNED_FIELDS:
+            value = sys.intern(value)
+
+        if key == 'keywords':
+            self._keywords = (tuple(map(sys.intern, value.get('positive', ()))),
+                              tuple(map(sys.intern, value.get('negative', ()))))
+        elif key in _SLOT_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        try:
+            if key == 'keywords':
+                del self._keywords
+                return
+            if key in _SLOT_FIELDS:
+                delattr(self, key)
+                return
+        except AttributeError:
+            raise KeyError(key) from None
+
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __contains__(self, key):
+        if key == 'keywords':
+            return hasattr(self, '_keywords')
+        if key in _SLOT_FIELDS:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key in ARTICLE_FIELDS:
+            if key in self:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"ArticleRecord({dict(self)!r})"
+
+    def compact(self):
+        """Buang konten penuh (sudah diskor & bila perlu tersimpan di ArticleStore)"""
+        self.pop('content', None)
+        return self
@@ -0,0 +1,118 @@
+"""Rekam & putar ulang respons mentah provider (gzip JSONL append-only)
+
+Setiap rekaman adalah satu baris JSON dalam member gzip tersendiri, sehingga
+file bisa terus ditambah (juga dari beberapa run) dan tetap terbaca walau
+proses berhenti di tengah jalan. API key tidak pernah ikut direkam.
+
+    client = NewsAPIClient(recorder=ProviderRecorder('rekaman.jsonl.gz'))
+    client = NewsAPIClient(replay=ProviderReplay('rekaman.jsonl.gz', latency='recorded'))
+"""
+import gzip
+import itertools
+import json
+import threading
+import time
+import zlib
+
+from .client import ProviderError
+
+# Parameter request yang tidak ikut direkam maupun dipakai sebagai key
+SECRET_PARAMS = ('apikey',)
+
+
+def request_key(provider, params):
+    """Key rekaman: provider + parameter request (tanpa API key), urutan stabil"""
+    public = {name: value for name, value in params.items() if name not in SECRET_PARAMS}
+    return json.dumps([provider, public], sort_keys=True, ensure_ascii=False)
+
+
+class ProviderRecorder:
+    """Tambahkan respons mentah provider ke file gzip JSONL"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, provider, params, status, body, seconds):
+        entry = {
+            'provider': provider,
+            'params': {name: value for name, value in params.items() if name not in SECRET_PARAMS},
+            'status': status,
+            'seconds': round(seconds, 4),
+            'recorded_at': time.time(),
+            'body': body
+        }
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+
+        with self._lock, gzip.open(self.path, 'ab') as f:
+            f.write(line)
+
+
+def read_recordings(path):
+    """Yield semua rekaman; member terakhir yang terpotong diabaikan"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    while data:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        try:
+            chunk = decompressor.decompress(data)
+        except zlib.error:
+            return
+        if not decompressor.eof:
+            return
+
+        for line in chunk.decode('utf-8').splitlines():
+            if line:
+                yield json.loads(line)
+        data = decompressor.unused_data
+
+
+class ProviderReplay:
+    """Layani request provider dari file rekaman, tanpa jaringan
+
+    latency: None (langsung), 'recorded' (durasi asli rekaman) atau angka
+    detik tetap. Rekaman dengan key sama diputar bergiliran.
+    """
+
+    def __init__(self, path, latency=None):
+        self.path = path
+        self.latency = latency
+        self._recordings = {}
+        self._lock = threading.Lock()
+
+        for entry in read_recordings(path):
+            key = request_key(entry['provider'], entry['params'])
+            self._recordings.setdefault(key, []).append(entry)
+
+        self._cursors = {key: itertools.cycle(entries) for key, entries in self._recordings.items()}
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._recordings.values())
+
+    def queries(self):
+        """Query unik yang ada di rekaman (urut sesuai rekaman pertama)"""
+        seen = {}
+        for entries in self._recordings.values():
+            seen.setdefault(entries[0]['params'].get('q'), None)
+        return [query for query in seen if query]
+
+    def serve(self, provider, params):
+        """(payload JSON, byte respons) untuk request ini; ProviderError bila tak ada/gagal"""
+        key = request_key(provider, params)
+        with self._lock:
+            cursor = self._cursors.get(key)
+            entry = next(cursor) if cursor is not None else None
+
+        if entry is None:
+            raise ProviderError(f"Tidak ada rekaman untuk {provider} {params.get('q')!r}")
+
+        if self.latency == 'recorded':
+            time.sleep(entry['seconds'])
+        elif self.latency:
+            time.sleep(self.latency)
+
+        if entry['status'] != 200:
+            raise ProviderError(f"HTTP {entry['status']} (rekaman)")
+
+        return json.loads(entry['body']), len(entry['body'].encode('utf-8'))
@@ -0,0 +1,142 @@
+"""Cache hasil analisis in-process yang dibagi semua sesi"""
+from collections import OrderedDict
+from concurrent.futures import Future
+import threading
+import time
+
+from .metrics import CACHE_LOOKUPS
+
+# ============================================================================
+# RESULT CACHE CLASS
+# ============================================================================
+RESULT_CACHE_TTL_SECONDS = 5 * 60
+RESULT_CACHE_MAX_ENTRIES = 64
+
+# Hasil untuk sesi yang menunggu bila pemilik compute() berhenti tanpa hasil
+_ABANDONED = object()
+
+
+class ResultCache:
+    """LRU + TTL untuk ringkasan yang sudah jadi, dengan coalescing request.
+    
+    Bila beberapa sesi meminta key yang sama bersamaan, hanya satu yang
+    menjalankan fetch & analisis; sisanya menunggu hasil yang sama. Aman
+    dipakai dari banyak thread (setiap sesi Streamlit punya thread sendiri).
+    """
+    
+    HIT = 'hit'
+    COALESCED = 'coalesced'
+    COMPUTED = 'computed'
+    
+    def __init__(self, ttl=RESULT_CACHE_TTL_SECONDS, max_entries=RESULT_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(query, news_type, max_articles, max_pages=1, *options):
+        return (query.strip().lower(), news_type, max_articles, max_pages, *options)
+    
+    def _lookup(self, key, now):
+        """Entri segar (value, created_at) atau None; dipanggil dengan lock"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        value, created_at, ttl = entry
+        if now - created_at > (ttl or self.ttl):
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value, created_at
+    
+    def get(self, key):
+        """(value, umur_detik) bila ada dan masih segar, selain itu None"""
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key, now)
+        
+        if entry is None:
+            return None
+        return entry[0], now - entry[1]
+    
+    def put(self, key, value, ttl=None):
+        """Simpan hasil; ttl (detik) menggantikan TTL default untuk entri ini saja"""
+        with self._lock:
+            self._entries[key] = (value, time.time(), ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_or_compute(self, key, compute):
+        """Kembalikan (value, status, umur_detik); compute() dijalankan sekali per key
+        
+        Hasil None tidak disimpan, sehingga kegagalan fetch tidak ikut di-cache.
+        Hanya Exception dari compute() yang diteruskan ke sesi yang menunggu;
+        bila pemilik berhenti karena hal lain (mis. rerun Streamlit), salah satu
+        sesi yang menunggu menjalankan compute() miliknya sendiri.
+        """
+        while True:
+            now = time.time()
+            
+            with self._lock:
+                entry = self._lookup(key, now)
+                if entry is not None:
+                    self.hits += 1
+                    CACHE_LOOKUPS.inc(cache='result', result='hit')
+                    return entry[0], self.HIT, now - entry[1]
+                
+                future = self._inflight.get(key)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    self._inflight[key] = future
+                    self.misses += 1
+                    CACHE_LOOKUPS.inc(cache='result', result='miss')
+                else:
+                    self.coalesced += 1
+                    CACHE_LOOKUPS.inc(cache='result', result='coalesced')
+            
+            if owner:
+                break
+            
+            value = future.result()
+            if value is not _ABANDONED:
+                return value, self.COALESCED, 0
+        
+        try:
+            value = compute()
+        except Exception as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        except BaseException:
+            with self._lock:
+                del self._inflight[key]
+            future.set_result(_ABANDONED)
+            raise
+        
+        with self._lock:
+            del self._inflight[key]
+        if value is not None:
+            self.put(key, value)
+        future.set_result(value)
+        
+        return value, self.COMPUTED, 0
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'entries': len(self._entries),
+                'inflight': len(self._inflight)
+            }
@@ -0,0 +1,79 @@
+"""Pool koneksi HTTP keep-alive dengan retry/backoff per provider"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ============================================================================
+# HTTP SESSION POOL CLASS
+# ============================================================================
+HTTP_POOL_SIZE = 10
+HTTP_TIMEOUT = (5, 15)  # (connect, read) dalam detik
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CappedRetry(Retry):
+    """Retry dengan exponential backoff yang menghormati Retry-After (maks. 30 detik)"""
+    
+    RETRY_AFTER_MAX = 30
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_MAX)
+
+
+class HTTPSessionPool:
+    """Satu requests.Session (keep-alive, gzip, retry) per provider.
+    
+    Dibuat sekali lalu dipakai ulang oleh semua NewsAPIClient agar koneksi
+    TCP/TLS ke newsdata.io dan gnews.io tidak dibangun ulang setiap fetch.
+    """
+    
+    def __init__(self, pool_size=HTTP_POOL_SIZE, max_retries=HTTP_MAX_RETRIES,
+                 backoff_factor=HTTP_BACKOFF_FACTOR):
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._sessions = {}
+        self._lock = threading.Lock()
+    
+    def get(self, provider):
+        """Session untuk provider, dibuat saat pertama kali dibutuhkan"""
+        with self._lock:
+            session = self._sessions.get(provider)
+            if session is None:
+                session = self._build_session()
+                self._sessions[provider] = session
+            return session
+    
+    def _build_session(self):
+        retry = CappedRetry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        return session
+    
+    def close(self):
+        """Tutup semua koneksi di pool"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
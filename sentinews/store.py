@@ -0,0 +1,354 @@
+"""Arsip artikel terskor yang persisten di disk (SQLite)"""
+from collections import Counter
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from .analyzer import TOKEN_PATTERN
+from .cache import CACHE_DIR
+from .client import normalize_published
+from .dedup import normalize_title, normalize_url
+from .records import ArticleRecord
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# ARTICLE STORE CLASS
+# ============================================================================
+# Batas parameter per query IN (...) agar aman untuk SQLite lama (999)
+STORE_LOOKUP_CHUNK = 400
+
+# Ambang jawaban lokal: arsip dipakai tanpa memanggil provider bila topik
+# diperbarui <= LOCAL_MAX_AGE_SECONDS lalu dan artikel yang terbit dalam
+# LOCAL_RECENT_SECONDS terakhir mencakup >= LOCAL_MIN_COVERAGE dari max_articles
+LOCAL_MAX_AGE_SECONDS = 30 * 60
+LOCAL_MIN_COVERAGE = 0.8
+LOCAL_RECENT_SECONDS = 3 * 24 * 60 * 60
+
+# Field artikel yang dikembalikan ArticleStore.articles() (konten penuh tetap di disk)
+STORED_FIELDS = ('title', 'description', 'source', 'url', 'image', 'publishedAt', 'language',
+                 'sentiment', 'confidence', 'keywords', 'duplicate_count')
+
+
+def normalize_topic(query):
+    return query.strip().lower()
+
+
+def content_hash(article):
+    """Hash judul (ternormalisasi) + deskripsi, untuk artikel sama dengan URL berbeda"""
+    text = normalize_title(article.get('title')) + '\n' + ' '.join((article.get('description') or '').lower().split())
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def fts_query(query):
+    """Query FTS5 dari topik: semua kata harus muncul (seperti query provider)"""
+    return ' AND '.join(f'"{token}"' for token in TOKEN_PATTERN.findall(query.lower()))
+
+
+def article_key(article):
+    """Key utama artikel: URL kanonik, atau hash konten bila URL kosong"""
+    return normalize_url(article.get('url')) or 'sha1:' + content_hash(article)
+
+
+class ArticleStore:
+    """Arsip artikel beserta skor sentimennya, per topik.
+
+    Artikel dikenali dari URL kanonik atau hash kontennya, jadi artikel yang
+    sudah pernah diskor tidak perlu diskor ulang dan fetch berikutnya cukup
+    memakai berita yang lebih baru dari watermark topik per provider & bahasa
+    (watermarks/mark). Diindeks menurut topik, sumber dan waktu terbit, plus
+    indeks full-text (FTS5) atas judul, deskripsi & konten sehingga topik baru
+    pun bisa dijawab dari arsip (local_answer) bila cukup segar dan lengkap.
+    """
+
+    def __init__(self, path=None, max_age=LOCAL_MAX_AGE_SECONDS, min_coverage=LOCAL_MIN_COVERAGE,
+                 recent=LOCAL_RECENT_SECONDS):
+        self.path = path or os.path.join(CACHE_DIR, 'articles.sqlite')
+        self.max_age = max_age
+        self.min_coverage = min_coverage
+        self.recent = recent
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY,
+                    url_key TEXT NOT NULL UNIQUE,
+                    content_hash TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    description TEXT,
+                    content TEXT,
+                    source TEXT,
+                    url TEXT,
+                    image TEXT,
+                    language TEXT,
+                    published_raw TEXT,
+                    published_at TEXT NOT NULL,
+                    sentiment TEXT NOT NULL,
+                    confidence REAL NOT NULL,
+                    keywords TEXT NOT NULL,
+                    duplicate_count INTEGER NOT NULL DEFAULT 0,
+                    stored_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS articles_content_hash ON articles (content_hash);
+                CREATE INDEX IF NOT EXISTS articles_source ON articles (source);
+                CREATE INDEX IF NOT EXISTS articles_published_at ON articles (published_at);
+
+                CREATE TABLE IF NOT EXISTS article_topics (
+                    topic TEXT NOT NULL,
+                    article_id INTEGER NOT NULL REFERENCES articles (id),
+                    PRIMARY KEY (topic, article_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS topic_fetches (
+                    topic TEXT PRIMARY KEY,
+                    fetched_at REAL NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS fetch_marks (
+                    topic TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    published_at TEXT NOT NULL,
+                    PRIMARY KEY (topic, provider, language)
+                );
+            """)
+
+            # Arsip lama tanpa kolom bahasa: artikelnya tidak ikut jawaban per bahasa
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+            if 'language' not in columns:
+                self._conn.execute("ALTER TABLE articles ADD COLUMN language TEXT")
+
+            # FTS5 ada di hampir semua build SQLite; tanpanya hanya pencarian per topik
+            try:
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+                    "title, description, content, content='articles', content_rowid='id', "
+                    "tokenize='unicode61 remove_diacritics 2')"
+                )
+                self.fts = True
+            except sqlite3.OperationalError as e:
+                logger.warning("FTS5 tidak tersedia (%s), pencarian hanya per topik", e)
+                self.fts = False
+
+            # Arsip lama tanpa indeks full-text: bangun ulang sekali. COUNT(*) pada
+            # articles_fts membaca tabel articles (external content), jadi yang
+            # dihitung adalah baris indeks di articles_fts_docsize
+            if self.fts:
+                indexed = self._conn.execute("SELECT COUNT(*) FROM articles_fts_docsize").fetchone()[0]
+                stored = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+                if indexed != stored:
+                    logger.info("Membangun ulang indeks full-text (%d/%d artikel terindeks)", indexed, stored)
+                    self._conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+    def watermarks(self, query):
+        """{(provider, bahasa): waktu terbit terbaru yang sudah tersimpan} untuk topik
+
+        Dipakai sebagai since per panggilan provider (plan_provider_calls);
+        hanya diperbarui lewat mark() setelah seluruh hasil panggilan disimpan.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT provider, language, published_at FROM fetch_marks WHERE topic = ?",
+                (normalize_topic(query),)
+            ).fetchall()
+        return {(provider, language): published_at for provider, language, published_at in rows}
+
+    def mark(self, query, provider, language, articles):
+        """Majukan watermark (topik, provider, bahasa) ke artikel terbaru dari satu panggilan"""
+        latest = max(filter(None, (normalize_published(article.get('publishedAt')) for article in articles)),
+                     default=None)
+        if latest is None:
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO fetch_marks (topic, provider, language, published_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (topic, provider, language) DO UPDATE SET "
+                "published_at = MAX(published_at, excluded.published_at)",
+                (normalize_topic(query), provider, language, latest)
+            )
+
+    def _lookup(self, column, values):
+        """{nilai kolom: (id, sentiment, confidence, keywords)} untuk baris yang cocok"""
+        found = {}
+        values = list(set(values))
+
+        for start in range(0, len(values), STORE_LOOKUP_CHUNK):
+            chunk = values[start:start + STORE_LOOKUP_CHUNK]
+            rows = self._conn.execute(
+                f"SELECT {column}, id, sentiment, confidence, keywords FROM articles "
+                f"WHERE {column} IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for value, *stored in rows:
+                found[value] = stored
+        return found
+
+    def restore(self, articles):
+        """Isi skor tersimpan ke artikel yang sudah dikenal; kembalikan yang belum (perlu diskor)"""
+        articles = list(articles)
+        keys = [(article_key(article), content_hash(article)) for article in articles]
+
+        with self._lock:
+            by_url = self._lookup('url_key', [url_key for url_key, _ in keys])
+            by_hash = self._lookup('content_hash', [digest for _, digest in keys])
+
+        new = []
+        for article, (url_key, digest) in zip(articles, keys):
+            stored = by_url.get(url_key) or by_hash.get(digest)
+            if stored is None:
+                new.append(article)
+            else:
+                _, sentiment, confidence, keywords = stored
+                article.update(sentiment=sentiment, confidence=confidence, keywords=json.loads(keywords))
+        return new
+
+    def add(self, query, articles):
+        """Simpan artikel terskor (yang sudah ada cukup dikaitkan ke topik)"""
+        topic = normalize_topic(query)
+        now = time.time()
+
+        with self._lock, self._conn:
+            for article in articles:
+                url_key, digest = article_key(article), content_hash(article)
+                row = self._conn.execute(
+                    "SELECT id FROM articles WHERE url_key = ? OR content_hash = ? LIMIT 1", (url_key, digest)
+                ).fetchone()
+
+                if row is None:
+                    article_id = self._conn.execute(
+                        "INSERT INTO articles (url_key, content_hash, title, description, content, source, url, "
+                        "image, language, published_raw, published_at, sentiment, confidence, keywords, "
+                        "duplicate_count, stored_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (url_key, digest, article.get('title', ''), article.get('description'),
+                         article.get('content'), article.get('source'), article.get('url'), article.get('image'),
+                         article.get('language'), article.get('publishedAt'), normalize_published(article.get('publishedAt')),
+                         article['sentiment'], article.get('confidence', 0),
+                         json.dumps(article.get('keywords', []), ensure_ascii=False),
+                         article.get('duplicate_count', 0), now)
+                    ).lastrowid
+                    if self.fts:
+                        self._conn.execute(
+                            "INSERT INTO articles_fts (rowid, title, description, content) VALUES (?, ?, ?, ?)",
+                            (article_id, article.get('title', ''), article.get('description'),
+                             article.get('content'))
+                        )
+                else:
+                    article_id = row[0]
+                    self._conn.execute(
+                        "UPDATE articles SET duplicate_count = MAX(duplicate_count, ?) WHERE id = ?",
+                        (article.get('duplicate_count', 0), article_id)
+                    )
+
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO article_topics (topic, article_id) VALUES (?, ?)", (topic, article_id)
+                )
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO topic_fetches (topic, fetched_at) VALUES (?, ?)", (topic, now)
+            )
+
+    def _matching(self, query):
+        """(klausa WHERE, parameter) untuk artikel topik ini atau yang cocok full-text"""
+        clause = "a.id IN (SELECT article_id FROM article_topics WHERE topic = ?)"
+        params = [normalize_topic(query)]
+
+        match = fts_query(query) if self.fts else ''
+        if match:
+            clause += " OR a.id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)"
+            params.append(match)
+        return clause, params
+
+    def articles(self, query, limit=100, exclude=(), since=None, languages=None):
+        """Artikel terskor untuk topik (termasuk yang cocok full-text), terbaru dulu
+
+        exclude: artikel yang sudah dimiliki pemanggil.
+        since ('YYYY-MM-DDTHH:MM:SSZ'): hanya artikel yang terbit sejak waktu itu.
+        languages: hanya artikel dengan bahasa ini (mis. NEWS_TYPE_LANGUAGES[news_type]).
+        """
+        excluded = {article_key(article) for article in exclude}
+        clause, params = self._matching(query)
+        if since:
+            clause = f"({clause}) AND a.published_at >= ?"
+            params.append(since)
+        if languages is not None:
+            clause = f"({clause}) AND a.language IN ({','.join('?' * len(languages))})"
+            params.extend(languages)
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT a.url_key, a.title, a.description, a.source, a.url, a.image, a.published_raw, a.language, "
+                "a.sentiment, a.confidence, a.keywords, a.duplicate_count "
+                f"FROM articles a WHERE {clause} ORDER BY a.published_at DESC, a.id DESC LIMIT ?",
+                (*params, limit + len(excluded))
+            ).fetchall()
+
+        result = []
+        for url_key, *values in rows:
+            if url_key in excluded:
+                continue
+            article = dict(zip(STORED_FIELDS, values))
+            article['keywords'] = json.loads(article['keywords'])
+            result.append(ArticleRecord(article))
+        return result[:limit]
+
+    def timeline(self, query):
+        """(published_at, sentiment) semua artikel topik untuk TrendAggregator.from_arrays"""
+        clause, params = self._matching(query)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT a.published_at, a.sentiment FROM articles a WHERE {clause}", params
+            ).fetchall()
+        return [row[0] for row in rows], [row[1] for row in rows]
+
+    def age(self, query):
+        """Detik sejak topik ini terakhir diperbarui: fetch topik itu sendiri atau
+        artikel cocok terbaru yang masuk arsip (None bila belum pernah)"""
+        clause, params = self._matching(query)
+
+        with self._lock:
+            fetched = self._conn.execute(
+                "SELECT fetched_at FROM topic_fetches WHERE topic = ?", (normalize_topic(query),)
+            ).fetchone()
+            stored = self._conn.execute(f"SELECT MAX(a.stored_at) FROM articles a WHERE {clause}", params).fetchone()
+
+        updated_at = max((row[0] for row in (fetched, stored) if row and row[0] is not None), default=None)
+        return None if updated_at is None else time.time() - updated_at
+
+    def local_answer(self, query, max_articles=100, languages=None):
+        """Artikel arsip untuk query bila cukup segar & lengkap, selain itu None (perlu fetch)
+
+        Dengan languages, setiap bahasa harus mencakup bagiannya sendiri, jadi
+        arsip berbahasa Inggris tidak menjawab permintaan berita lokal.
+        """
+        age = self.age(query)
+        if age is None or age > self.max_age:
+            return None
+
+        # Hanya berita yang baru terbit yang dihitung: artikel lama yang cocok
+        # full-text tidak boleh menggantikan fetch
+        since = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() - self.recent))
+        articles = self.articles(query, limit=max_articles, since=since, languages=languages)
+        if len(articles) < max_articles * self.min_coverage:
+            return None
+        if languages is not None:
+            counts = Counter(article['language'] for article in articles)
+            if any(counts[language] < max_articles * self.min_coverage / len(languages) for language in languages):
+                return None
+        return articles
+
+    def count(self, query=None):
+        """Jumlah artikel tersimpan (semua topik atau satu topik)"""
+        with self._lock:
+            if query is None:
+                return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM article_topics WHERE topic = ?", (normalize_topic(query),)
+            ).fetchone()[0]
@@ -0,0 +1,28 @@
+"""Daftar topik preset (crypto & saham)"""
+
+# Nama tampilan -> query yang dikirim ke provider
+PRESET_TOPICS = {
+    "Bitcoin (BTC)": "BTC Bitcoin",
+    "Ripple (XRP)": "XRP Ripple",
+    "Ethereum (ETH)": "ETH Ethereum",
+    "Aneka Tambang (ANTM)": "ANTM Aneka Tambang",
+    "Telkom (TLKM)": "TLKM Telkom Indonesia",
+    "Bank BRI (BBRI)": "BBRI Bank BRI",
+    "Bank BCA (BBCA)": "BBCA Bank BCA"
+}
+
+# Query preset -> ticker watchlist yang sama; pemanasan background membuat
+# hasil preset dari satu fetch watchlist bersama
+PRESET_TICKERS = {query: query.split()[0] for query in PRESET_TOPICS.values()}
+
+# Ticker -> alias untuk watchlist; dua alias pertama dipakai di query provider,
+# semua alias dipakai untuk merutekan artikel ke ticker
+TICKER_ALIASES = {
+    'BTC': ['BTC', 'Bitcoin'],
+    'XRP': ['XRP', 'Ripple'],
+    'ETH': ['ETH', 'Ethereum'],
+    'ANTM': ['ANTM', 'Aneka Tambang', 'Antam'],
+    'TLKM': ['TLKM', 'Telkom', 'Telkom Indonesia'],
+    'BBRI': ['BBRI', 'Bank BRI', 'Bank Rakyat Indonesia'],
+    'BBCA': ['BBCA', 'Bank BCA', 'Bank Central Asia']
+}
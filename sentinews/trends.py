@@ -0,0 +1,208 @@
+"""Trend sentimen per waktu: bucket jam/hari & jendela geser 1 jam / 24 jam"""
+import time
+
+from .client import parse_published
+
+# ============================================================================
+# TREND AGGREGATOR CLASS
+# ============================================================================
+SENTIMENTS = ('positive', 'negative', 'neutral')
+SENTIMENT_INDEX = {sentiment: index for index, sentiment in enumerate(SENTIMENTS)}
+
+# label -> (rentang detik, resolusi slot detik)
+TREND_WINDOWS = {'1h': (3600, 60), '24h': (86400, 3600)}
+
+# Lebar bucket & jumlah bucket terakhir yang ditampilkan per granularitas
+TREND_BUCKETS = {'hour': 3600, 'day': 86400}
+TREND_FRAME_LIMITS = {'hour': 72, 'day': 90}
+
+# Momentum = skor bersih (positif - negatif) / total atas N bucket terakhir
+TREND_MOMENTUM_SPAN = 6
+
+
+def published_epoch(value):
+    """publishedAt satu artikel -> epoch detik UTC, atau None"""
+    parsed = parse_published(value)
+    return int(parsed.timestamp()) if parsed is not None else None
+
+
+def published_epochs(values):
+    """publishedAt banyak artikel (format campuran) -> array float epoch detik UTC, NaN bila tak terbaca"""
+    import numpy as np
+    import pandas as pd
+
+    parsed = pd.to_datetime(pd.Series(list(values), dtype=object), utc=True, errors='coerce', format='ISO8601')
+    seconds = (parsed - pd.Timestamp(0, tz='UTC')) // pd.Timedelta(seconds=1)
+    return seconds.to_numpy(dtype='float64', na_value=np.nan)
+
+
+def sentiment_codes(sentiments):
+    """Label sentimen -> array indeks SENTIMENTS (-1 bila tidak dikenal)"""
+    import numpy as np
+
+    return np.fromiter((SENTIMENT_INDEX.get(sentiment, -1) for sentiment in sentiments), dtype=np.int64)
+
+
+class SlidingWindow:
+    """Jumlah per sentimen dalam `span` detik terakhir.
+
+    Ring buffer berisi slot `resolution` detik; menambah artikel dan
+    menggeser waktu sama-sama O(1) (amortized), tanpa menghitung ulang.
+    """
+
+    def __init__(self, span, resolution, now):
+        self.span = span
+        self.resolution = resolution
+        self.size = span // resolution
+        self.head = int(now) // resolution
+        self.totals = [0, 0, 0]
+        self._slots = [None] * self.size
+        self._counts = [[0, 0, 0] for _ in range(self.size)]
+
+    def _clear(self, position):
+        counts = self._counts[position]
+        for index in range(3):
+            self.totals[index] -= counts[index]
+            counts[index] = 0
+        self._slots[position] = None
+
+    def advance(self, now):
+        """Geser akhir jendela ke `now`, slot yang keluar jendela dibuang"""
+        head = int(now) // self.resolution
+        for slot in range(max(self.head + 1, head - self.size + 1), head + 1):
+            self._clear(slot % self.size)
+        self.head = max(self.head, head)
+
+    def add(self, epoch, index, count=1):
+        # Waktu terbit di masa depan (beda jam provider) dihitung di slot terbaru
+        slot = min(int(epoch) // self.resolution, self.head)
+        if slot <= self.head - self.size:
+            return
+
+        position = slot % self.size
+        if self._slots[position] != slot:
+            self._clear(position)
+            self._slots[position] = slot
+        self._counts[position][index] += count
+        self.totals[index] += count
+
+    def counts(self):
+        counts = dict(zip(SENTIMENTS, self.totals))
+        counts['total'] = sum(self.totals)
+        return counts
+
+
+class TrendAggregator:
+    """Jumlah sentimen per jam & per hari plus jendela geser (TREND_WINDOWS).
+
+    add() memperbarui semua bucket & jendela dalam O(1) sehingga bisa dipakai
+    bersama stream_scored_batches; from_arrays() membangun hal yang sama
+    secara tervektorisasi (NumPy) untuk puluhan ribu artikel arsip.
+    """
+
+    def __init__(self, now=None, windows=TREND_WINDOWS):
+        self.now = time.time() if now is None else now
+        self.buckets = {granularity: {} for granularity in TREND_BUCKETS}
+        self.windows = {label: SlidingWindow(span, resolution, self.now)
+                        for label, (span, resolution) in windows.items()}
+        self.undated = 0
+
+    def add_epoch(self, epoch, sentiment, count=1):
+        """Masukkan artikel dengan waktu terbit epoch (None bila tidak diketahui)"""
+        index = SENTIMENT_INDEX[sentiment]
+        if epoch is None:
+            self.undated += count
+            return
+
+        for granularity, width in TREND_BUCKETS.items():
+            self.buckets[granularity].setdefault(int(epoch) // width, [0, 0, 0])[index] += count
+        for window in self.windows.values():
+            window.add(epoch, index, count)
+
+    def add(self, article):
+        """Masukkan satu artikel yang sudah diskor"""
+        self.add_epoch(published_epoch(article.get('publishedAt')), article['sentiment'])
+
+    def consume(self, articles):
+        """Teruskan artikel dari generator sambil memperbarui trend"""
+        for article in articles:
+            self.add(article)
+            yield article
+
+    @classmethod
+    def from_articles(cls, articles, now=None):
+        articles = list(articles)
+        return cls.from_arrays(published_epochs(article.get('publishedAt') for article in articles),
+                               [article['sentiment'] for article in articles], now=now)
+
+    @classmethod
+    def from_arrays(cls, epochs, sentiments, now=None):
+        """Bangun trend dari array epoch (NaN = tak diketahui) & label sentimen sekaligus"""
+        import numpy as np
+
+        trend = cls(now=now)
+        epochs = np.asarray(epochs, dtype='float64')
+        codes = sentiment_codes(sentiments)
+
+        known = codes >= 0
+        dated = known & ~np.isnan(epochs)
+        trend.undated = int(np.count_nonzero(known & ~dated))
+
+        seconds = epochs[dated].astype(np.int64)
+        codes = codes[dated]
+
+        # Satu np.unique per granularitas: (bucket, sentimen) -> jumlah
+        for granularity, width in TREND_BUCKETS.items():
+            keys, counts = np.unique(seconds // width * 3 + codes, return_counts=True)
+            buckets = trend.buckets[granularity]
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                buckets.setdefault(key // 3, [0, 0, 0])[key % 3] += count
+
+        for window in trend.windows.values():
+            recent = seconds > (window.head - window.size) * window.resolution
+            keys, counts = np.unique(
+                seconds[recent] // window.resolution * 3 + codes[recent], return_counts=True
+            )
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                window.add((key // 3) * window.resolution, key % 3, count)
+
+        return trend
+
+    def advance(self, now=None):
+        """Geser jendela ke waktu sekarang (mis. sebelum menampilkan hasil lama)"""
+        self.now = time.time() if now is None else now
+        for window in self.windows.values():
+            window.advance(self.now)
+
+    def window(self, label):
+        """{'positive', 'negative', 'neutral', 'total'} dalam jendela label (mis. '24h')"""
+        return self.windows[label].counts()
+
+    def frame(self, granularity='hour', limit=None, momentum_span=TREND_MOMENTUM_SPAN):
+        """DataFrame per bucket (index waktu UTC): jumlah per sentimen, net & momentum
+
+        Bucket kosong diisi 0 agar jeda waktu terlihat; hanya `limit` bucket
+        terakhir (default TREND_FRAME_LIMITS) yang dikembalikan.
+        """
+        import pandas as pd
+
+        width = TREND_BUCKETS[granularity]
+        limit = limit or TREND_FRAME_LIMITS[granularity]
+        buckets = self.buckets[granularity]
+        if not buckets:
+            return pd.DataFrame(columns=[*SENTIMENTS, 'total', 'net', 'momentum'])
+
+        last = max(buckets)
+        keys = range(max(min(buckets), last - limit + 1), last + 1)
+        df = pd.DataFrame([buckets.get(key, [0, 0, 0]) for key in keys], columns=list(SENTIMENTS),
+                          index=pd.to_datetime([key * width for key in keys], unit='s', utc=True))
+
+        df['total'] = df[list(SENTIMENTS)].sum(axis=1)
+        balance = df['positive'] - df['negative']
+        df['net'] = (balance / df['total'].where(df['total'] > 0)).fillna(0.0)
+        # Rata-rata tertimbang volume: bucket sepi tidak mendominasi momentum
+        df['momentum'] = (
+            balance.rolling(momentum_span, min_periods=1).sum()
+            / df['total'].rolling(momentum_span, min_periods=1).sum().where(lambda total: total > 0)
+        ).fillna(0.0)
+        return df
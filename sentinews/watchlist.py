@@ -0,0 +1,149 @@
+"""Mode watchlist: banyak ticker dengan panggilan provider seminimal mungkin"""
+from concurrent.futures import ThreadPoolExecutor
+
+from .analyzer import KeywordMatcher, SentimentAnalyzer
+from .client import NewsAPIClient
+from .dedup import NearDuplicateDetector
+from .pipeline import create_sentiment_summary, plan_provider_calls
+from .topics import TICKER_ALIASES
+
+# ============================================================================
+# WATCHLIST
+# ============================================================================
+# Panjang maksimum parameter q per provider (free tier)
+PROVIDER_QUERY_MAX_LENGTH = {'NewsData.io': 100, 'GNews': 200}
+QUERY_ALIASES_PER_TICKER = 2
+
+
+def build_or_queries(tickers, max_length, aliases=None):
+    """Gabungkan alias ticker menjadi query OR sesedikit mungkin (<= max_length)"""
+    aliases = aliases or TICKER_ALIASES
+    terms = []
+    
+    for ticker in tickers:
+        for alias in aliases.get(ticker, [ticker])[:QUERY_ALIASES_PER_TICKER]:
+            terms.append(f'"{alias}"' if ' ' in alias else alias)
+    
+    queries = []
+    current = ''
+    
+    for term in terms:
+        candidate = f"{current} OR {term}" if current else term
+        if current and len(candidate) > max_length:
+            queries.append(current)
+            current = term
+        else:
+            current = candidate
+    
+    if current:
+        queries.append(current)
+    
+    return queries
+
+
+class TickerRouter:
+    """Inverted index alias -> ticker untuk merutekan artikel yang sudah diambil"""
+    
+    def __init__(self, tickers, aliases=None):
+        aliases = aliases or TICKER_ALIASES
+        self.tickers = list(tickers)
+        self.matcher = KeywordMatcher({
+            ticker: aliases.get(ticker, [ticker]) for ticker in self.tickers
+        })
+    
+    def route(self, article):
+        """Daftar ticker yang disebut di judul/deskripsi/konten artikel"""
+        text = f"{article.get('title', '')} {article.get('description', '')} {article.get('content', '')}"
+        hits = self.matcher.distinct(text)
+        return [ticker for ticker in self.tickers if hits[ticker]]
+
+
+def plan_watchlist_calls(client, tickers, news_type='both'):
+    """Panggilan provider untuk seluruh watchlist memakai query OR gabungan"""
+    calls = []
+    
+    for provider, fetch in [('NewsData.io', client.fetch_newsdata_io), ('GNews', client.fetch_gnews)]:
+        for query in build_or_queries(tickers, PROVIDER_QUERY_MAX_LENGTH[provider]):
+            calls.extend(
+                call for call in plan_provider_calls(client, query, news_type) if call[1] == fetch
+            )
+    
+    return calls
+
+
+def analyze_watchlist(tickers=None, news_type='both', max_articles=100, client=None, analyzer=None):
+    """Ambil, skor & rutekan berita untuk semua ticker sekaligus
+    
+    Setiap artikel diambil dan diskor sekali, lalu dibagikan ke setiap ticker
+    yang disebutnya. Mengembalikan dict dengan 'summaries' (ticker -> ringkasan),
+    'articles' (ticker -> artikel, maks. max_articles per ticker), 'unmatched'
+    (jumlah artikel tanpa ticker) dan 'calls' (jumlah panggilan provider).
+    """
+    tickers = list(tickers or TICKER_ALIASES)
+    if client is None:
+        client = NewsAPIClient()
+    calls = plan_watchlist_calls(client, tickers, news_type)
+    analyzed = fetch_watchlist_articles(calls, analyzer)
+    
+    result = route_watchlist(analyzed, tickers, max_articles)
+    # Konten penuh hanya dibutuhkan untuk skoring & routing
+    for article in analyzed:
+        article.compact()
+    
+    return {**result, 'calls': len(calls)}
+
+
+def fetch_watchlist_articles(calls, analyzer=None):
+    """Jalankan panggilan watchlist bersamaan, gabungkan duplikat & skor sekali"""
+    if analyzer is None:
+        analyzer = SentimentAnalyzer()
+    
+    with ThreadPoolExecutor(max_workers=max(len(calls), 1)) as executor:
+        futures = [executor.submit(fetch, **kwargs) for _, fetch, kwargs in calls]
+        results = [future.result() for future in futures]
+    
+    detector = NearDuplicateDetector()
+    unique_articles = detector.collapse(
+        article for articles in results for article in articles
+        if article.get('title', '').strip()
+    )
+    return analyzer.analyze_batch(unique_articles)
+
+
+def route_watchlist(analyzed, tickers, max_articles=100):
+    """Bagikan artikel terskor ke ticker yang disebutnya: 'summaries', 'articles' & 'unmatched'"""
+    router = TickerRouter(tickers)
+    routed = {ticker: [] for ticker in tickers}
+    unmatched = 0
+    
+    for article in analyzed:
+        matched = router.route(article)
+        if not matched:
+            unmatched += 1
+        for ticker in matched:
+            if len(routed[ticker]) < max_articles:
+                routed[ticker].append(article)
+    
+    return {
+        'summaries': {ticker: create_sentiment_summary(routed[ticker]) for ticker in tickers},
+        'articles': routed,
+        'unmatched': unmatched
+    }
+
+
+def watchlist_table(summaries):
+    """Baris tabel ringkasan per ticker (siap untuk DataFrame/CSV)"""
+    rows = []
+    
+    for ticker, summary in summaries.items():
+        summary = summary or {}
+        rows.append({
+            'Ticker': ticker,
+            'Total': summary.get('total', 0),
+            'Positif (%)': round(summary.get('positive_pct', 0), 1),
+            'Negatif (%)': round(summary.get('negative_pct', 0), 1),
+            'Netral (%)': round(summary.get('neutral_pct', 0), 1),
+            'Trend': f"{summary['trend_emoji']} {summary['overall_trend']}" if summary else '-'
+        })
+    
+    return rows